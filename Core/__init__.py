@@ -0,0 +1 @@
+"""Shared core used by both the Imperative and Declarative front-ends."""
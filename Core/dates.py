@@ -0,0 +1,34 @@
+from datetime import date
+from functools import lru_cache
+
+
+@lru_cache(maxsize=65536)
+def parse_date(date_string):
+    """
+    Parse a transaction date into a (year, month, day) tuple.
+
+    Accepts 'YYYY-M-D', 'YYYY-M' (day defaults to 1) and 'DD/MM/YYYY'.
+    Results are memoized on the raw string since ledgers repeat dates heavily.
+
+    :param date_string: The date as stored on the transaction.
+    :raises ValueError: If the string matches none of the supported formats.
+    """
+    s = date_string.strip()
+    if '/' in s:
+        parts = s.split('/')
+        if len(parts) != 3:
+            raise ValueError(f"Unrecognised date: {date_string!r}")
+        return int(parts[2]), int(parts[1]), int(parts[0])
+
+    parts = s.split('-')
+    if len(parts) == 3:
+        return int(parts[0]), int(parts[1]), int(parts[2])
+    if len(parts) == 2:
+        return int(parts[0]), int(parts[1]), 1
+    raise ValueError(f"Unrecognised date: {date_string!r}")
+
+
+@lru_cache(maxsize=65536)
+def to_date(date_string):
+    """Parse a transaction date into a datetime.date (memoized, see parse_date)."""
+    return date(*parse_date(date_string))
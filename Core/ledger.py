@@ -0,0 +1,154 @@
+from array import array
+
+from Core.dates import parse_date
+from Core.money import parse_cents
+
+INCOME = 0
+EXPENSE = 1
+
+
+def month_index(year, month):
+    """Encode (year, month) as a single int so consecutive months are consecutive ints."""
+    return year * 12 + month - 1
+
+
+def month_of(index):
+    """Decode a month index back into a (year, month) tuple."""
+    year, month = divmod(index, 12)
+    return year, month + 1
+
+
+class Ledger:
+    """
+    Columnar transaction store shared by the Imperative and Declarative front-ends.
+
+    Each transaction is spread over parallel columns (date, month, category id,
+    amount, kind) so the aggregation kernels below can run as tight single
+    passes instead of attribute or key lookups on every row.
+
+    Amounts are integer cents in a 64-bit array, so every total is exact;
+    callers convert to currency units (Core.money.to_units) only for output.
+    """
+
+    def __init__(self):
+        self.dates = []                 # raw date strings, as given
+        self.months = array('l')        # month_index() of each date
+        self.category_ids = array('l')  # index into self.categories
+        self.amounts = array('q')       # integer cents
+        self.kinds = bytearray()        # INCOME or EXPENSE
+        self.categories = []
+        self._category_index = {}
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def category_id(self, category):
+        """Return the interned id of a category, registering it if needed."""
+        cid = self._category_index.get(category)
+        if cid is None:
+            cid = self._category_index[category] = len(self.categories)
+            self.categories.append(category)
+        return cid
+
+    def find_category(self, category):
+        """Return the id of a known category, or None if it has never been seen."""
+        return self._category_index.get(category)
+
+    def append(self, date, category, cents, kind):
+        """Append one transaction; cents is an int, kind is any 'Income'/'Expense' spelling."""
+        year, month, _ = parse_date(date)
+        self.dates.append(date)
+        self.months.append(month_index(year, month))
+        self.category_ids.append(self.category_id(category))
+        self.amounts.append(cents)
+        self.kinds.append(EXPENSE if kind.lower() == 'expense' else INCOME)
+
+    @classmethod
+    def from_transactions(cls, transactions):
+        """Build a ledger from Imperative Transaction objects."""
+        ledger = cls()
+        for t in transactions:
+            ledger.append(t.date, t.category, t.cents, t.transaction_type)
+        return ledger
+
+    @classmethod
+    def from_records(cls, records, type_key='type', in_cents=True):
+        """
+        Build a ledger from transaction dicts.
+
+        :param in_cents: True when 'amount' already holds integer cents (Declarative
+                         transactions); False to parse it from currency units
+                         (saved Imperative transactions).
+        """
+        ledger = cls()
+        for r in records:
+            amount = r['amount'] if in_cents else parse_cents(r['amount'])
+            ledger.append(r['date'], r['category'], amount, r[type_key])
+        return ledger
+
+    # --- aggregation kernels -------------------------------------------------
+
+    def totals(self):
+        """Return (total_income, total_expense) in one pass."""
+        sums = [0, 0]
+        for amount, kind in zip(self.amounts, self.kinds):
+            sums[kind] += amount
+        return sums[INCOME], sums[EXPENSE]
+
+    def category_totals(self, kind=EXPENSE):
+        """
+        Sum amounts per category, in order of first appearance.
+
+        :param kind: EXPENSE or INCOME to filter on, or None to sum every row.
+        """
+        sums = {}
+        get = sums.get
+        if kind is None:
+            for cid, amount in zip(self.category_ids, self.amounts):
+                sums[cid] = get(cid, 0) + amount
+        else:
+            for cid, amount, k in zip(self.category_ids, self.amounts, self.kinds):
+                if k == kind:
+                    sums[cid] = get(cid, 0) + amount
+        categories = self.categories
+        return {categories[cid]: total for cid, total in sums.items()}
+
+    def category_breakdown(self):
+        """Return {category: [income, expense]} in order of first appearance."""
+        sums = {}
+        for cid, amount, kind in zip(self.category_ids, self.amounts, self.kinds):
+            pair = sums.get(cid)
+            if pair is None:
+                pair = sums[cid] = [0, 0]
+            pair[kind] += amount
+        categories = self.categories
+        return {categories[cid]: pair for cid, pair in sums.items()}
+
+    def month_category_totals(self, kind=EXPENSE, signed=False, months=None):
+        """
+        Sum amounts per (year, month) and category.
+
+        :param kind: EXPENSE or INCOME to filter on, or None for every row.
+        :param signed: Count expenses as positive and income as negative
+                       (implies every row, whatever kind is).
+        :param months: Optional collection of month_index() values to restrict to.
+        :return: {(year, month): {category: total}}
+        """
+        sums = {}
+        for month, cid, amount, k in zip(self.months, self.category_ids, self.amounts, self.kinds):
+            if months is not None and month not in months:
+                continue
+            if signed:
+                if k != EXPENSE:
+                    amount = -amount
+            elif kind is not None and k != kind:
+                continue
+            bucket = sums.get(month)
+            if bucket is None:
+                bucket = sums[month] = {}
+            bucket[cid] = bucket.get(cid, 0) + amount
+        categories = self.categories
+        return {
+            month_of(month): {categories[cid]: total for cid, total in bucket.items()}
+            for month, bucket in sums.items()
+        }
@@ -0,0 +1,43 @@
+def parse_cents(value):
+    """
+    Convert an amount to integer cents.
+
+    Decimal strings ('12', '-3.5', '+0.075') are parsed digit by digit, with
+    no float in between, so '0.1' is exactly 10 cents. Digits past the
+    cents are rounded half away from zero. Ints are whole units; floats are
+    rounded to the nearest cent via their decimal form.
+
+    :param value: str, int or float amount in currency units.
+    :raises ValueError: If a string is not a plain decimal number.
+    """
+    if isinstance(value, str):
+        s = value.strip()
+        negative = s[:1] == '-'
+        if negative or s[:1] == '+':
+            s = s[1:]
+        whole, _, fraction = s.partition('.')
+        if not (whole or fraction) or (whole and not whole.isdigit()) or (fraction and not fraction.isdigit()):
+            raise ValueError(f"Invalid amount: {value!r}")
+        cents = int(whole or 0) * 100 + int(fraction[:2].ljust(2, '0'))
+        if fraction[2:3] >= '5':
+            cents += 1
+        return -cents if negative else cents
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid amount: {value!r}")
+    if isinstance(value, int):
+        return value * 100
+    if isinstance(value, float):
+        return parse_cents(f"{value:.6f}")
+    raise ValueError(f"Invalid amount: {value!r}")
+
+
+def format_cents(cents):
+    """Render integer cents as a decimal string with two places ('-12.05')."""
+    sign = '-' if cents < 0 else ''
+    whole, rest = divmod(abs(cents), 100)
+    return f"{sign}{whole}.{rest:02d}"
+
+
+def to_units(cents):
+    """Convert integer cents to a float amount for display and JSON (exact up to 2**53 cents)."""
+    return cents / 100
@@ -0,0 +1,111 @@
+import heapq
+import random
+
+from Core.ledger import EXPENSE, month_index, month_of
+
+
+def quickselect(values, k):
+    """
+    Return the k-th smallest (0-based) item of values in expected O(n).
+
+    Partitions with list comprehensions around a random pivot, keeping only
+    the side that holds k, so no full sort is performed.
+    """
+    if not 0 <= k < len(values):
+        raise IndexError("selection index out of range")
+    while True:
+        pivot = values[random.randrange(len(values))]
+        lows = [v for v in values if v < pivot]
+        if k < len(lows):
+            values = lows
+            continue
+        equal = sum(1 for v in values if v == pivot)
+        if k < len(lows) + equal:
+            return pivot
+        k -= len(lows) + equal
+        values = [v for v in values if v > pivot]
+
+
+def percentile(values, q):
+    """
+    Return the q-th percentile (0-100) of values, interpolating linearly
+    between the two nearest ranks. Returns None for an empty sequence.
+    """
+    if not values:
+        return None
+    if not 0 <= q <= 100:
+        raise ValueError("percentile must be between 0 and 100")
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    low_value = quickselect(values, lower)
+    if position == lower:
+        return low_value
+    high_value = quickselect(values, lower + 1)
+    return low_value + (high_value - low_value) * (position - lower)
+
+
+def _expense_rows(ledger, category=None, period=None):
+    """Yield indices of expense rows, optionally restricted to a category and/or (year, month)."""
+    cid = ledger.find_category(category) if category is not None else None
+    if category is not None and cid is None:
+        return
+    month = month_index(*period) if period is not None else None
+    for i, (k, c, m) in enumerate(zip(ledger.kinds, ledger.category_ids, ledger.months)):
+        if k == EXPENSE and (cid is None or c == cid) and (month is None or m == month):
+            yield i
+
+
+def top_expenses(ledger, n=10, category=None, period=None):
+    """
+    Return the row indices of the n largest expenses, largest first.
+
+    Uses a bounded heap (heapq.nlargest), so memory stays O(n) and the
+    ledger is never fully sorted. Ties keep ledger order.
+    """
+    return heapq.nlargest(n, _expense_rows(ledger, category, period), key=ledger.amounts.__getitem__)
+
+
+def top_categories(ledger, n=5, kind=EXPENSE):
+    """Return the n categories with the largest totals as [(category, total in cents)], largest first."""
+    return heapq.nlargest(n, ledger.category_totals(kind).items(), key=lambda item: item[1])
+
+
+def spending_percentiles(ledger, percentiles=(50,), by="category", category=None, period=None):
+    """
+    Compute expense-amount percentiles per group.
+
+    :param percentiles: Percentiles to compute (0-100); 50 is the median.
+    :param by: 'category', 'month', 'category_month', or None for one overall group.
+    :param category: Optional category to restrict to.
+    :param period: Optional (year, month) to restrict to.
+    :return: {group: {percentile: value in cents}} where group is a category name,
+             a (year, month) tuple, a (category, (year, month)) tuple, or 'all'.
+    """
+    if by not in ("category", "month", "category_month", None):
+        raise ValueError("by must be 'category', 'month', 'category_month' or None")
+    groups = {}
+    amounts, cids, months = ledger.amounts, ledger.category_ids, ledger.months
+    for i in _expense_rows(ledger, category, period):
+        if by == "category":
+            key = cids[i]
+        elif by == "month":
+            key = months[i]
+        elif by == "category_month":
+            key = (cids[i], months[i])
+        else:
+            key = "all"
+        values = groups.get(key)
+        if values is None:
+            values = groups[key] = []
+        values.append(amounts[i])
+
+    def label(key):
+        if by == "category":
+            return ledger.categories[key]
+        if by == "month":
+            return month_of(key)
+        if by == "category_month":
+            return ledger.categories[key[0]], month_of(key[1])
+        return key
+
+    return {label(key): {q: percentile(values, q) for q in percentiles} for key, values in groups.items()}
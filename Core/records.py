@@ -0,0 +1,44 @@
+import csv
+
+from Core.money import format_cents, parse_cents
+
+
+def read_csv_rows(file, columns=None, amount_key='amount'):
+    """
+    Yield one dict per CSV data row, with the amount parsed to integer cents.
+
+    Parsing is done by the csv module in a single pass, so both front-ends
+    import at the same speed whatever the file size. Rows with a different
+    number of fields than the header, or an invalid amount, are skipped.
+
+    :param file: Open text file (opened with newline='').
+    :param columns: Names given to the fields by position; default: the header's own names.
+    :param amount_key: Column holding the amount in currency units.
+    """
+    reader = csv.reader(file)
+    header = next(reader, None)
+    if header is None:
+        return
+    names = list(columns) if columns is not None else [name.strip() for name in header]
+    for values in reader:
+        if len(values) != len(header):
+            continue
+        row = dict(zip(names, values))
+        try:
+            row[amount_key] = parse_cents(row[amount_key])
+        except (KeyError, ValueError):
+            continue
+        yield row
+
+
+def write_csv_rows(file, rows, columns, amount_key='amount'):
+    """
+    Write rows as CSV under a header of columns, with amounts in integer
+    cents rendered as exact decimals ('12.50').
+
+    :param file: Open text file (opened with newline='').
+    :param rows: Iterable of dicts holding at least the given columns.
+    """
+    writer = csv.writer(file, lineterminator='\n')
+    writer.writerow(columns)
+    writer.writerows([format_cents(row[c]) if c == amount_key else row[c] for c in columns] for row in rows)
@@ -0,0 +1,259 @@
+import csv
+import heapq
+import json
+import os
+import time
+
+from Core.dates import parse_date
+from Core.ledger import EXPENSE, INCOME
+from Core.money import to_units
+
+KIND_NAMES = {INCOME: "Income", EXPENSE: "Expense"}
+
+
+class ReportModel:
+    def __init__(self):
+        """Every figure that goes into a financial report, computed once."""
+        self.total_income = 0
+        self.total_expense = 0
+        self.balance = 0
+        self.category_breakdown = {}    # {category: {"Income": x, "Expense": y}}
+        self.spending_by_category = {}  # expenses only, in order of first expense
+        self.budgets = []               # dicts: category, amount, period, window, spent, utilization
+        self.savings_goals = []         # dicts: goal_name, target_amount, months_to_save, saved_amount, remaining
+        self.recent_transactions = []   # dicts: date, category, transaction_type, amount; newest first
+        self.build_time = 0.0
+
+    def to_dict(self):
+        """Convert the report into plain data for JSON rendering."""
+        return {
+            "summary": {
+                "total_income": self.total_income,
+                "total_expense": self.total_expense,
+                "balance": self.balance,
+            },
+            "category_breakdown": self.category_breakdown,
+            "budgets": self.budgets,
+            "savings_goals": self.savings_goals,
+            "recent_transactions": self.recent_transactions,
+            "spending_by_category": self.spending_by_category,
+        }
+
+
+def build_report_model(ledger, budgets, savings_goals, recent=10):
+    """
+    Compute every report section from a single scan of the ledger.
+
+    The most recent transactions are kept in a bounded min-heap of size
+    `recent`, so no full sort of the ledger is needed.
+
+    :param ledger: A Core.ledger.Ledger.
+    :param budgets: {category: {"amount": x, "period": p}}, optionally with the
+                    "spent" and "window" of a live budget's current period;
+                    without them, spending over the whole ledger is used.
+    :param savings_goals: {goal_name: {"target_amount": x, "months_to_save": n, "saved_amount": y}}
+    :param recent: How many of the latest transactions to include.
+    """
+    start = time.perf_counter()
+    totals = [0, 0]
+    breakdown = {}
+    spending = {}
+    heap = []
+    for i, (date, cid, amount, kind) in enumerate(
+            zip(ledger.dates, ledger.category_ids, ledger.amounts, ledger.kinds)):
+        totals[kind] += amount
+        pair = breakdown.get(cid)
+        if pair is None:
+            pair = breakdown[cid] = [0, 0]
+        pair[kind] += amount
+        if kind == EXPENSE:
+            spending[cid] = spending.get(cid, 0) + amount
+        if recent:
+            # Newer dates win; on equal dates the earlier row wins, like a stable sort
+            entry = (parse_date(date), -i)
+            if len(heap) < recent:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+    # Ledger sums are exact integer cents; convert to currency units once, here
+    categories = ledger.categories
+    model = ReportModel()
+    model.total_income, model.total_expense = to_units(totals[INCOME]), to_units(totals[EXPENSE])
+    model.balance = to_units(totals[INCOME] - totals[EXPENSE])
+    model.category_breakdown = {
+        categories[cid]: {"Income": to_units(income), "Expense": to_units(expense)}
+        for cid, (income, expense) in breakdown.items()
+    }
+    model.spending_by_category = {categories[cid]: to_units(total) for cid, total in spending.items()}
+
+    for category, details in budgets.items():
+        spent = details.get("spent", model.spending_by_category.get(category, 0))
+        amount = details["amount"]
+        model.budgets.append({
+            "category": category,
+            "amount": amount,
+            "period": details["period"],
+            "window": details.get("window"),
+            "spent": spent,
+            "utilization": (spent / amount) * 100 if amount > 0 else 0.0,
+        })
+
+    for goal_name, goal in savings_goals.items():
+        model.savings_goals.append({
+            "goal_name": goal_name,
+            "target_amount": goal["target_amount"],
+            "months_to_save": goal["months_to_save"],
+            "saved_amount": goal["saved_amount"],
+            "remaining": goal["target_amount"] - goal["saved_amount"],
+        })
+
+    for _, negative_index in sorted(heap, reverse=True):
+        i = -negative_index
+        model.recent_transactions.append({
+            "date": ledger.dates[i],
+            "category": categories[ledger.category_ids[i]],
+            "transaction_type": KIND_NAMES[ledger.kinds[i]],
+            "amount": to_units(ledger.amounts[i]),
+        })
+
+    model.build_time = time.perf_counter() - start
+    return model
+
+
+def write_text_report(model, file):
+    """Stream a computed report to an open text file, one section at a time."""
+    write = file.write
+
+    write("=== FINANCIAL SUMMARY ===\n")
+    write(f"Total Income:   ${model.total_income:.2f}\n")
+    write(f"Total Expenses: ${model.total_expense:.2f}\n")
+    write(f"Current Balance: ${model.balance:.2f}\n\n")
+
+    write("=== CATEGORY BREAKDOWN ===\n")
+    for category, values in model.category_breakdown.items():
+        write(f"{category}:\n"
+              f"  Income:   ${values['Income']:.2f}\n"
+              f"  Expense:  ${values['Expense']:.2f}\n")
+    write("\n")
+
+    write("=== BUDGET STATUS ===\n")
+    for b in model.budgets:
+        write(f"{b['category']} Budget:\n"
+              f"  Budget Amount: ${b['amount']:.2f} ({b['period']})\n"
+              f"  Utilization:   {b['utilization']:.2f}%\n")
+    write("\n")
+
+    write("=== SAVINGS GOALS ===\n")
+    for g in model.savings_goals:
+        write(f"{g['goal_name']}:\n"
+              f"  Target Amount: ${g['target_amount']:.2f}\n"
+              f"  Months to Save: {g['months_to_save']}\n"
+              f"  Current Savings: ${g['saved_amount']:.2f}\n"
+              f"  Remaining to Save: ${g['remaining']:.2f}\n")
+    write("\n")
+
+    write("=== RECENT TRANSACTIONS ===\n")
+    for t in model.recent_transactions:
+        write(f"{t['date']} | {t['category']} | {t['transaction_type']}: ${t['amount']:.2f}\n")
+
+    write("\n=== MONTHLY SPENDING SUMMARY ===\n")
+    for category, amount in model.spending_by_category.items():
+        write(f"{category}: ${amount:.2f}\n")
+
+
+def write_json_report(model, file):
+    """Render a computed report as a JSON document."""
+    json.dump(model.to_dict(), file, indent=4)
+
+
+def write_csv_report(model, file):
+    """
+    Render a computed report as long-format CSV: section,name,metric,value.
+
+    One row per figure keeps every section in a single table that
+    spreadsheets and dashboards can filter without re-parsing text.
+    """
+    writer = csv.writer(file)
+    writer.writerow(("section", "name", "metric", "value"))
+    writer.writerow(("summary", "", "total_income", model.total_income))
+    writer.writerow(("summary", "", "total_expense", model.total_expense))
+    writer.writerow(("summary", "", "balance", model.balance))
+    for category, values in model.category_breakdown.items():
+        writer.writerow(("category_breakdown", category, "income", values["Income"]))
+        writer.writerow(("category_breakdown", category, "expense", values["Expense"]))
+    for b in model.budgets:
+        for metric in ("amount", "period", "window", "spent", "utilization"):
+            writer.writerow(("budget", b["category"], metric, b[metric]))
+    for g in model.savings_goals:
+        for metric in ("target_amount", "months_to_save", "saved_amount", "remaining"):
+            writer.writerow(("savings_goal", g["goal_name"], metric, g[metric]))
+    for rank, t in enumerate(model.recent_transactions, 1):
+        for metric in ("date", "category", "transaction_type", "amount"):
+            writer.writerow(("recent_transaction", rank, metric, t[metric]))
+    for category, amount in model.spending_by_category.items():
+        writer.writerow(("spending", category, "expense", amount))
+
+
+def write_markdown_report(model, file):
+    """Render a computed report as Markdown tables."""
+    write = file.write
+    write("# Financial Report\n\n## Summary\n\n| Metric | Amount |\n| --- | ---: |\n")
+    write(f"| Total Income | {model.total_income:.2f} |\n"
+          f"| Total Expenses | {model.total_expense:.2f} |\n"
+          f"| Balance | {model.balance:.2f} |\n")
+
+    write("\n## Category Breakdown\n\n| Category | Income | Expense |\n| --- | ---: | ---: |\n")
+    for category, values in model.category_breakdown.items():
+        write(f"| {category} | {values['Income']:.2f} | {values['Expense']:.2f} |\n")
+
+    write("\n## Budget Status\n\n| Category | Budget | Period | Window | Spent | Utilization |\n"
+          "| --- | ---: | --- | --- | ---: | ---: |\n")
+    for b in model.budgets:
+        write(f"| {b['category']} | {b['amount']:.2f} | {b['period']} | {b['window'] or '-'} | "
+              f"{b['spent']:.2f} | {b['utilization']:.2f}% |\n")
+
+    write("\n## Savings Goals\n\n| Goal | Target | Months | Saved | Remaining |\n"
+          "| --- | ---: | ---: | ---: | ---: |\n")
+    for g in model.savings_goals:
+        write(f"| {g['goal_name']} | {g['target_amount']:.2f} | {g['months_to_save']} | "
+              f"{g['saved_amount']:.2f} | {g['remaining']:.2f} |\n")
+
+    write("\n## Recent Transactions\n\n| Date | Category | Type | Amount |\n| --- | --- | --- | ---: |\n")
+    for t in model.recent_transactions:
+        write(f"| {t['date']} | {t['category']} | {t['transaction_type']} | {t['amount']:.2f} |\n")
+
+    write("\n## Spending Summary\n\n| Category | Spent |\n| --- | ---: |\n")
+    for category, amount in model.spending_by_category.items():
+        write(f"| {category} | {amount:.2f} |\n")
+
+
+REPORT_WRITERS = {
+    "txt": write_text_report,
+    "json": write_json_report,
+    "csv": write_csv_report,
+    "md": write_markdown_report,
+}
+
+
+def export_report_formats(model, base_path, formats, buffering=1 << 20):
+    """
+    Render one computed report to several formats without recomputing it.
+
+    :param model: A ReportModel from build_report_model().
+    :param base_path: Output path; any extension is replaced by each format's.
+    :param formats: Iterable of keys of REPORT_WRITERS ('txt', 'json', 'csv', 'md').
+    :return: {format: path written}
+    :raises ValueError: If a format is not supported.
+    """
+    unknown = [f for f in formats if f not in REPORT_WRITERS]
+    if unknown:
+        raise ValueError(f"Unsupported report format(s): {', '.join(unknown)}")
+    root, _ = os.path.splitext(base_path)
+    written = {}
+    for fmt in formats:
+        path = f"{root}.{fmt}"
+        with open(path, "w", buffering=buffering, newline="" if fmt == "csv" else None) as file:
+            REPORT_WRITERS[fmt](model, file)
+        written[fmt] = path
+    return written
@@ -0,0 +1,107 @@
+from datetime import date
+
+from Core.dates import to_date
+from Core.ledger import EXPENSE, month_index, month_of
+from Core.money import to_units
+
+FREQUENCIES = ("month", "week")
+
+
+def _as_date(value):
+    return to_date(value) if isinstance(value, str) else value
+
+
+def _period_of(day, freq):
+    """Period index of a date: month_index() for months, Monday-based week number for weeks."""
+    if freq == "month":
+        return month_index(day.year, day.month)
+    return (day.toordinal() - 1) // 7
+
+
+def _period_label(index, freq):
+    if freq == "month":
+        year, month = month_of(index)
+        return f"{year}-{month:02d}"
+    return date.fromordinal(index * 7 + 1).isoformat()  # Monday starting the week
+
+
+def _change(previous, current):
+    return (current - previous) / previous * 100 if previous else None
+
+
+def _series(values, window):
+    """
+    Wrap per-period values (in cents) with period-over-period change and a
+    trailing rolling average; the running sums stay exact in cents and only
+    the output is converted to currency units.
+    """
+    change = [None] + [_change(p, c) for p, c in zip(values, values[1:])]
+    rolling = [None] * len(values)
+    running = 0
+    for i, value in enumerate(values):
+        running += value
+        if i >= window:
+            running -= values[i - window]
+        if i >= window - 1:
+            rolling[i] = to_units(running / window)
+    return {"values": [to_units(v) for v in values], "change_pct": change, "rolling_avg": rolling}
+
+
+def spending_series(ledger, start=None, end=None, freq="month", window=3):
+    """
+    Build a spending time series for every category in one pass over the ledger.
+
+    :param ledger: A Core.ledger.Ledger.
+    :param start: First date to include (str or datetime.date); defaults to the earliest expense.
+    :param end: Last date to include (str or datetime.date); defaults to the latest expense.
+                Both ends are widened to whole periods.
+    :param freq: 'month' or 'week'.
+    :param window: Number of periods in the rolling average.
+    :return: {"freq", "window", "periods": [labels],
+              "total": series, "categories": {category: series}}, where each
+             series holds "values", "change_pct" (vs. the previous period,
+             None when that was zero) and "rolling_avg" (None until a full window).
+    """
+    if freq not in FREQUENCIES:
+        raise ValueError(f"freq must be one of {', '.join(FREQUENCIES)}")
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    first = _period_of(_as_date(start), freq) if start is not None else None
+    last = _period_of(_as_date(end), freq) if end is not None else None
+
+    sums = {}  # (period, category id) -> total
+    for day, cid, amount, kind in zip(ledger.dates, ledger.category_ids, ledger.amounts, ledger.kinds):
+        if kind != EXPENSE:
+            continue
+        period = _period_of(to_date(day), freq)
+        if (first is not None and period < first) or (last is not None and period > last):
+            continue
+        key = (period, cid)
+        sums[key] = sums.get(key, 0) + amount
+
+    if not sums and (first is None or last is None):
+        first, count = 0, 0  # nothing to anchor an open-ended range on
+    else:
+        if first is None:
+            first = min(period for period, _ in sums)
+        if last is None:
+            last = max(period for period, _ in sums)
+        count = max(last - first + 1, 0)
+
+    totals = [0] * count
+    per_category = {}
+    for (period, cid), amount in sums.items():
+        values = per_category.get(cid)
+        if values is None:
+            values = per_category[cid] = [0] * count
+        values[period - first] += amount
+        totals[period - first] += amount
+
+    categories = ledger.categories
+    return {
+        "freq": freq,
+        "window": window,
+        "periods": [_period_label(first + i, freq) for i in range(count)],
+        "total": _series(totals, window),
+        "categories": {categories[cid]: _series(values, window) for cid, values in per_category.items()},
+    }
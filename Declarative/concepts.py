@@ -1,134 +1,88 @@
 #from functools import reduce
 import json
+import os
+import sys
 
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+if REPO_ROOT not in sys.path:       # the shared Core package lives at the repo root
+    sys.path.insert(0, REPO_ROOT)
+from Core.dates import parse_date
+from Core.ledger import Ledger
+from Core.money import format_cents, parse_cents, to_units
+from Core.records import read_csv_rows, write_csv_rows
+from Core.report import build_report_model, export_report_formats
 
-def manual_split(string, delimiter):
-    def split_helper(s, delimiter, result):
-        if not s:
-            return result
-        elif s[0] == delimiter:
-            return split_helper(s[1:], delimiter, result + [''])
-        else:
-            return split_helper(s[1:], delimiter, result[:-1] + [result[-1] + s[0]])
 
-    return split_helper(string, delimiter, [''])
+# The helpers in this file loop instead of recursing, so they handle inputs of
+# any length (thousands of rows, categories or commands) without hitting the
+# recursion limit.
 
+def manual_split(string, delimiter):
+    result, start = [], 0
+    for i, char in enumerate(string):
+        if char == delimiter:
+            result.append(string[start:i])
+            start = i + 1
+    return result + [string[start:]]
 
 
-def manual_strip(s, chars_to_remove=" \t\n\r"):
-    def strip_helper(s, chars_to_remove, start, end):
-        if start >= end:
-            return s[start:end]
-        if s[start] in chars_to_remove:
-            return strip_helper(s, chars_to_remove, start + 1, end)
-        if s[end - 1] in chars_to_remove:
-            return strip_helper(s, chars_to_remove, start, end - 1)
-        
-        return s[start:end]
 
-    return strip_helper(s, chars_to_remove, 0, manual_len(s))
+def manual_strip(s, chars_to_remove=" \t\n\r"):
+    start, end = 0, manual_len(s)
+    while start < end and s[start] in chars_to_remove:
+        start += 1
+    while end > start and s[end - 1] in chars_to_remove:
+        end -= 1
+    return s[start:end]
 
 
 def manual_sum(iterable):
-    if not iterable:
-        return 0
-    return iterable[0] + manual_sum(iterable[1:])
-
-
-
-def manual_sort(lst):
-    if manual_len(lst) <= 1:
-        return lst
-    pivot = lst[0]
-    def partition(lst, pivot):
-        if not lst:
-            return [], []
-        head, *tail = lst
-        lesser, greater = partition(tail, pivot)
-        if head <= pivot:
-            return lesser + [head], greater
-        else:
-            return lesser, greater + [head]
-    
-    lesser, greater = partition(lst[1:], pivot)
-    
-    return manual_sort(lesser) + [pivot] + manual_sort(greater)
+    total = 0
+    for value in iterable:
+        total += value
+    return total
+
+
+
+def manual_sort(lst):          # bottom-up merge sort: runs of width 1, 2, 4, ... merged in place of recursion
+    result = list(lst)
+    width = 1
+    while width < manual_len(result):
+        merged = []
+        for start in range(0, manual_len(result), 2 * width):
+            left, right = result[start:start + width], result[start + width:start + 2 * width]
+            i = j = 0
+            while i < manual_len(left) and j < manual_len(right):
+                if right[j] < left[i]:
+                    merged.append(right[j])
+                    j += 1
+                else:
+                    merged.append(left[i])
+                    i += 1
+            merged += left[i:] + right[j:]
+        result = merged
+        width *= 2
+    return result
 
 
 def manual_len(input_data):
-    def len_helper(input_data, count):
-        if not input_data:
-            return count
-        return len_helper(input_data[1:], count + 1)
-
-    return len_helper(input_data, 0)
+    count = 0
+    for _ in input_data:
+        count += 1
+    return count
 
 
 def custom_map(func, iterable):
-    iterable = tuple(iterable)
-    if not iterable:
-        return []
-    return [func(iterable[0])] + custom_map(func, iterable[1:])
+    return [func(item) for item in iterable]
 
 def custom_filter(func, iterable):
-    iterable = tuple(iterable)
-    if not iterable:
-        return []
-    if func(iterable[0]):
-        return [iterable[0]] + custom_filter(func, iterable[1:])
-    return custom_filter(func, iterable[1:])
-
-def manual_parse_date(date_string):
-    date_string = manual_strip(date_string)
-    delimiter = '/' if '/' in date_string else '-'
-    date_parts = manual_split(date_string, delimiter)
-    return tuple(custom_map(int, date_parts[::-1])) if delimiter == '/' else tuple(custom_map(int, date_parts))
-
-def group_by_month(transactions):
-    def get_unique_dates(transactions, result=None):
-        if result is None:
-            result = set()
-        if not transactions:
-            return result
-        date = manual_parse_date(transactions[0]['date'])[:2]
-        return get_unique_dates(transactions[1:], result | {date})
-
-    unique_dates = get_unique_dates(transactions)
+    return [item for item in iterable if func(item)]
 
-    
-    def category_total(transactions, year, month, category, index=0, total=0):
-        if index >= manual_len(transactions):
-            return total
-        t = transactions[index]
-        if manual_parse_date(t['date'])[:2] == (year, month) and t['category'] == category:
-            amount = t['amount'] if t['type'] == 'expense' else -t['amount']
-            return category_total(transactions, year, month, category, index + 1, total + amount)
-        return category_total(transactions, year, month, category, index + 1, total)
-
-    def construct_month_data(transactions, year, month):         #containing totals for each category.
-        categories = get_unique_categories(transactions, year, month)
-        return dict(custom_map(lambda category: (category, category_total(transactions, year, month, category)), categories))
-
-    def get_unique_categories(transactions, year, month, index=0, categories=None):
-        if categories is None:
-            categories = set()
-        if index >= manual_len(transactions):
-            return categories
-        t = transactions[index]
-        if manual_parse_date(t['date'])[:2] == (year, month):
-            categories.add(t['category'])
-        return get_unique_categories(transactions, year, month, index + 1, categories)
-
-    def construct_result(unique_dates, transactions, index=0, result=None):
-        if result is None:
-            result = {}
-        if index >= manual_len(unique_dates):
-            return result
-        year, month = unique_dates[index]
-        result[(year, month)] = construct_month_data(transactions, year, month)
-        return construct_result(unique_dates, transactions, index + 1, result)
-
-    return construct_result(tuple(unique_dates), transactions)
+def manual_parse_date(date_string):       # (year, month, day), memoized in Core.dates
+    return parse_date(date_string)
+
+def group_by_month(transactions):      # {(year, month): {category: net spending}}, via the shared ledger kernels
+    return Ledger.from_records(transactions).month_category_totals(signed=True)
 
 
 def compare_spending(current, previous):
@@ -138,7 +92,7 @@ def compare_spending(current, previous):
 def create_insights_for_month(month, current_month_spending, spending_trends):      # generates insights for a given month
     total_spent, category_trends, total_trend = spending_trends
     current_month_insights = {
-        'Total': f"Total spending in {month[0]}-{month[1]:02d}: {total_spent:.2f}",
+        'Total': f"Total spending in {month[0]}-{month[1]:02d}: {format_cents(total_spent)}",
         **category_trends,
         'Total Trend': total_trend
     }
@@ -147,23 +101,13 @@ def create_insights_for_month(month, current_month_spending, spending_trends):
 def generate_monthly_insights(grouped_transactions, previous_month_spending=None, months=None, insights=None):  # comparing the insights of each category with the month before
     if months is None:
         months = manual_sort(tuple(grouped_transactions.keys()))  
-    if insights is None:
-        insights = []
-    if not months:
-        return insights
-    
-    month = months[0]
-    previous_month_spending = previous_month_spending or {}
-    spending_trends = calculate_spending_trends(grouped_transactions[month], previous_month_spending)
-
-    current_month_insights = create_insights_for_month(month, grouped_transactions[month], spending_trends)
-
-    return generate_monthly_insights(
-        grouped_transactions,
-        grouped_transactions[month], 
-        months[1:],  
-        insights + [current_month_insights]  
-    )
+    insights = list(insights or [])
+    for month in months:            # each month is compared with the one before it
+        previous_month_spending = previous_month_spending or {}
+        spending_trends = calculate_spending_trends(grouped_transactions[month], previous_month_spending)
+        insights.append(create_insights_for_month(month, grouped_transactions[month], spending_trends))
+        previous_month_spending = grouped_transactions[month]
+    return insights
 
 def calculate_spending_trends(current_month_spending, previous_month_spending):
     total_spent = manual_sum(tuple(current_month_spending.values()))  # Total spending for the current month
@@ -173,17 +117,8 @@ def calculate_spending_trends(current_month_spending, previous_month_spending):
         trend = compare_spending(current_spent, previous_spent)
         return f"Spending on {category} changed by {round(trend, 2)}%." if trend != 0 else None
 
-    def process_categories(categories, result=None):
-        if not categories:
-            return result if result else {}
-        category, current_spent = categories[0]
-        trend = category_trend(category, current_spent)
-        if trend:
-            result = result or {}
-            result[category] = trend
-        return process_categories(categories[1:], result)
-
-    category_trends = process_categories(list(current_month_spending.items()))
+    category_trends = dict(custom_filter(lambda item: item[1], custom_map(
+        lambda item: (item[0], category_trend(item[0], item[1])), current_month_spending.items())))
 
     previous_total_spent = manual_sum(tuple(previous_month_spending.values()))
     total_trend = compare_spending(total_spent, previous_total_spent)
@@ -208,7 +143,13 @@ def display_monthly_insights(insights):
 
 
 def add_transaction(transactions, new_transaction=None, file_path=None, file_type=None):
-    return tuple(transactions) + tuple(import_file(file_path, file_type) if file_path and file_type else (new_transaction,) if new_transaction else ())
+    added = tuple(import_file(file_path, file_type) if file_path and file_type else (new_transaction,) if new_transaction else ())
+    return tuple(transactions) + number_transactions(transactions, added)
+
+
+def number_transactions(transactions, added):      # gives added rows the sequence numbers after the last one ('seq')
+    start = transactions[-1]['seq'] + 1 if transactions else 1
+    return tuple(map(lambda item: {**item[1], 'seq': start + item[0]}, enumerate(added)))
 
 
 def set_budget(budgets, category, amount):
@@ -218,16 +159,7 @@ def set_budget(budgets, category, amount):
 
 
 def track_budget(transactions, budgets, threshold=0.9):
-    def accumulate_spending(transactions, index=0, result=None):
-        if result is None:
-            result = {}
-        if index >= manual_len(transactions):
-            return result
-        t = transactions[index]
-        new_amount = result.get(t['category'], 0) + t['amount']
-        return accumulate_spending(transactions, index + 1, {**result, t['category']: new_amount})
-    
-    spending_by_category = accumulate_spending(transactions)
+    spending_by_category = Ledger.from_records(transactions).category_totals(kind=None)
 
     filter_spending = custom_filter(
         lambda item: item[0] in budgets and item[1] >= budgets[item[0]] * threshold,
@@ -255,7 +187,7 @@ def set_savings_goal(savings_goals, goal_name, target_amount, months):
         'progress': 0,
         'monthly_savings': monthly_savings
     }
-    print(f"For your goal '{goal_name}', you need to save ${monthly_savings} per month.")
+    print(f"For your goal '{goal_name}', you need to save ${format_cents(monthly_savings)} per month.")
     return savings_goals + [new_goal]
 
 
@@ -276,21 +208,47 @@ def recommend_savings(savings_goals):
 
 
 
+CSV_COLUMNS = ('date', 'amount', 'category', 'type')
+
+
+def clean_transaction(t):       # strips the text fields before they are written out
+    return {**t, 'date': manual_strip(t['date']), 'category': manual_strip(t['category']), 'type': manual_strip(t['type'])}
+
+
 def export_csv(transactions, file_path):
     try:
-        def format_transaction(t):
-            return f"{manual_strip(t['date'])},{t['amount']},{manual_strip(t['category'])},{manual_strip(t['type'])}\n"
+        with open(file_path, 'w', newline='') as file:       # rows written by the shared core CSV writer
+            write_csv_rows(file, map(clean_transaction, transactions), CSV_COLUMNS)
 
-        lines = tuple(custom_map(format_transaction, transactions))  
-        with open(file_path, 'w') as file:
-            file.write('date,amount,category,type\n')  
-            file.writelines(lines)  
-        
         print(f"Transactions successfully exported to {file_path}")
     except Exception as e:
         print(f"Error exporting to CSV: {e}")
 
 
+def changes_since(transactions, checkpoint):      # rows added after a checkpoint; they are in seq order, so a binary search finds the first
+    start, end = 0, len(transactions)
+    while start < end:      # bisect_right by seq, written out since bisect's key= needs Python 3.10
+        middle = (start + end) // 2
+        if transactions[middle]['seq'] <= checkpoint:
+            start = middle + 1
+        else:
+            end = middle
+    return tuple(transactions[start:])
+
+
+def export_csv_since(transactions, file_path, checkpoint=0):      # exports only rows added after checkpoint, returns the new checkpoint
+    changes = changes_since(transactions, checkpoint)
+    try:
+        with open(file_path, 'w', newline='') as file:
+            write_csv_rows(file, map(clean_transaction, changes), ('seq',) + CSV_COLUMNS)
+
+        print(f"{len(changes)} new transactions exported to {file_path}")
+        return changes[-1]['seq'] if changes else checkpoint
+    except Exception as e:
+        print(f"Error exporting to CSV: {e}")
+    return checkpoint
+
+
 def import_file(file_path, file_type): 
     if file_type.lower() == 'csv':
         return import_csv(file_path)
@@ -302,20 +260,9 @@ def import_file(file_path, file_type):
 
 def import_csv(file_path):
     try:
-        with open(file_path, 'r') as file:
-            lines = file.readlines()
-            
-            def process_line(line):
-                values = manual_split(manual_strip(line, '\n'), ',')
-                if manual_len(values) == manual_len(manual_split(manual_strip(lines[0], '\n'), ',')) and values[1].strip().isdigit():
-                    return {
-                        'date': values[0], 
-                        'amount': int(values[1]) if values[1].strip() else 0, 
-                        'category': values[2], 
-                        'type': values[3]
-                    }
-                return None
-            transactions = tuple(filter(None, custom_map(process_line, lines[1:])))
+        with open(file_path, 'r', newline='') as file:
+            # fields taken by position; rows with the wrong field count or a non-numeric amount are skipped
+            transactions = tuple(read_csv_rows(file, CSV_COLUMNS))
             print(f"Successfully imported {manual_len(transactions)} transactions.")
             return transactions
 
@@ -331,7 +278,7 @@ def import_json(file_path):
         with open(file_path, 'r') as file:
             data = json.load(file)
             if isinstance(data, list):
-                transactions = tuple(data) 
+                transactions = tuple(map(lambda t: {**t, 'amount': parse_cents(t['amount'])}, data))   # amounts to cents
                 print(f"Transactions imported successfully. Now you have {manual_len(transactions)} transactions.")
                 return transactions
             print("Invalid JSON format: The data is not a list of transactions.")
@@ -349,15 +296,17 @@ def export_report(transactions, budgets, savings_goals, file_path, threshold=0.9
         def write_section(file, header, data, format_function):
             file.write(header + "\n")
             file.write("-" * 40 + "\n")
-            data = data or ("No data available.",)  
-            tuple(custom_map(lambda item: format_function(file, item), data))
+            if data:
+                tuple(custom_map(lambda item: format_function(file, item), data))
+            else:
+                file.write("No data available.\n")
             file.write("\n")
 
         def write_transaction(file, transaction):
             file.write(f"Date: {transaction['date']}, "
                        f"Category: {transaction['category']}, "
                        f"Type: {transaction['type']}, "
-                       f"Amount: {transaction['amount']}\n")
+                       f"Amount: {format_cents(transaction['amount'])}\n")
         
         def write_budget_and_alerts(file, budgets, transactions):
             file.write("2. Budget and Alerts\n")
@@ -365,11 +314,11 @@ def export_report(transactions, budgets, savings_goals, file_path, threshold=0.9
             if not budgets:
                 file.write("No budget set.\n")
             else:
-                tuple(custom_map(lambda item: file.write(f"Category: {item[0]}, Budget Limit: {item[1]}\n"), budgets.items()))
+                tuple(custom_map(lambda item: file.write(f"Category: {item[0]}, Budget Limit: {format_cents(item[1])}\n"), budgets.items()))
                 alerts = track_budget(transactions, budgets, threshold)
                 if alerts:
                     file.write("\nAlerts:\n")
-                    tuple(custom_map(lambda item: file.write(f"- Alert: Spending in '{item[0]}' exceeded the budget by {item[1]}\n"), alerts.items()))
+                    tuple(custom_map(lambda item: file.write(f"- Alert: Spending in '{item[0]}' exceeded the budget by {item[1] if isinstance(item[1], str) else format_cents(item[1])}\n"), alerts.items()))
                 else:
                     file.write("\nNo alerts triggered.\n")
             file.write("\n")
@@ -383,9 +332,9 @@ def export_report(transactions, budgets, savings_goals, file_path, threshold=0.9
             
             write_section(file, "3. Savings Goals and Recommendations", savings_goals, lambda file, goal: file.write(
                 f"Goal Name: {goal['goal_name']}\n"
-                f"Target Amount: ${goal['target_amount']}\n"
+                f"Target Amount: ${format_cents(goal['target_amount'])}\n"
                 f"Timeframe: {goal['months']} months\n"
-                f"Monthly Savings Needed: ${goal['monthly_savings']}\n"
+                f"Monthly Savings Needed: ${format_cents(goal['monthly_savings'])}\n"
                 "-".ljust(40, '-') + "\n"
             ))
 
@@ -409,10 +358,45 @@ def export_report(transactions, budgets, savings_goals, file_path, threshold=0.9
         print(f"An error occurred while generating the report: {e}")
 
 
-def main():
+def export_report_data(transactions, budgets, savings_goals, base_path, formats=('json', 'csv', 'md')):
+    try:           # the report is computed once by the shared core, then rendered to each format
+        model = build_report_model(
+            Ledger.from_records(transactions),
+            dict(custom_map(lambda item: (item[0], {'amount': to_units(item[1]), 'period': 'monthly'}), budgets.items())),
+            dict(custom_map(lambda goal: (goal['goal_name'], {
+                'target_amount': to_units(goal['target_amount']),
+                'months_to_save': goal['months'],
+                'saved_amount': to_units(goal['progress'])
+            }), savings_goals))
+        )
+        written = export_report_formats(model, base_path, formats)
+        tuple(custom_map(lambda path: print(f"Report written to {path}"), written.values()))
+        return written
+    except Exception as e:
+        print(f"An error occurred while generating the report: {e}")
+    return {}
+
+
+def scripted_input(file_path):      # replays a command file line by line in place of input()
+    with open(file_path, 'r') as file:
+        answers = iter(file.read().splitlines())
+
+    def read_input(prompt=''):
+        answer = next(answers, None)
+        if answer is None:
+            raise EOFError
+        return answer
+
+    return read_input
+
+
+def main(script_path=None):
     transactions = []
     budgets = {}
     savings_goals = []
+    export_checkpoint = 0           # last seq written by option 12
+    interactive = script_path is None
+    read_input = input if interactive else scripted_input(script_path)
 
     def display_menu():
         print("\n--- Personal Finance Application ---")
@@ -426,15 +410,18 @@ def main():
         print("8. Import Transactions (CSV/JSON)")
         print("9. Write Report to Word")
         print("10. Exit")
+        print("11. Export Report Data (JSON/CSV/Markdown)")
+        print("12. Export New Transactions csv (since the last export)")
 
     def process_choice(choice):
-        nonlocal transactions, budgets, savings_goals
+        nonlocal transactions, budgets, savings_goals, export_checkpoint
 
         if choice == '1':
-            date = input("Enter the transaction date (e.g., 2024-12-13): ")
-            amount = int(input("Enter the transaction amount: "))
-            category = input("Enter the category (e.g., Food, Rent): ")
-            transaction_type = input("Enter the transaction type (income/expense): ").lower()
+            date = read_input("Enter the transaction date (e.g., 2024-12-13): ")
+            amount_text = read_input("Enter the transaction amount: ")
+            category = read_input("Enter the category (e.g., Food, Rent): ")
+            transaction_type = read_input("Enter the transaction type (income/expense): ").lower()
+            amount = parse_cents(amount_text)       # parsed after every prompt, so a bad amount skips just this command
 
             new_transaction = {
                 "date": date,
@@ -443,13 +430,13 @@ def main():
                 "type": transaction_type
             }
             transactions = add_transaction(transactions, new_transaction=new_transaction)
-            print(f"Transaction added: {new_transaction}")
+            print(f"Transaction added: {dict(new_transaction, amount=format_cents(amount))}")
 
         elif choice == '2':
             print("\n--- All Transactions ---")
             if transactions:
                 transaction_strings = custom_map(
-                    lambda t: f"Date: {t['date']}, Amount: {t['amount']}, Category: {t['category']}, Type: {t['type']}", 
+                    lambda t: f"Date: {t['date']}, Amount: {format_cents(t['amount'])}, Category: {t['category']}, Type: {t['type']}", 
                     transactions
                 )
                 print("\n".join(transaction_strings))
@@ -457,17 +444,18 @@ def main():
                 print("No transactions available.")
 
         elif choice == '3':
-            category = input("Enter the category for the budget (e.g., Food, Rent): ")
-            amount = int(input(f"Enter the budget amount for {category}: "))
+            category = read_input("Enter the category for the budget (e.g., Food, Rent): ")
+            amount = parse_cents(read_input(f"Enter the budget amount for {category}: "))
             budgets = set_budget(budgets, category, amount)
-            print(f"Budget set for {category}: ${amount}")
+            print(f"Budget set for {category}: ${format_cents(amount)}")
 
         elif choice == '4':
-            goal_name = input("Enter the savings goal name (e.g., Vacation Fund): ")
-            target_amount = int(input("Enter the target amount for the goal: "))
-            months = int(input("Enter the number of months to reach the goal: "))
+            goal_name = read_input("Enter the savings goal name (e.g., Vacation Fund): ")
+            target_text = read_input("Enter the target amount for the goal: ")
+            months = int(read_input("Enter the number of months to reach the goal: "))
+            target_amount = parse_cents(target_text)
             savings_goals = set_savings_goal(savings_goals, goal_name, target_amount, months)
-            print(f"Savings goal set: {goal_name}, Target: ${target_amount}, Months: {months}")
+            print(f"Savings goal set: {goal_name}, Target: ${format_cents(target_amount)}, Months: {months}")
 
         elif choice == '5':
             alerts = track_budget(transactions, budgets)
@@ -477,7 +465,7 @@ def main():
                     lambda item: (
                         f"Warning: You're nearing the budget for {item[0]}."
                         if item[1] == 'nearing limit'
-                        else f"Alert: You've exceeded the budget for {item[0]} by ${abs(item[1])}."
+                        else f"Alert: You've exceeded the budget for {item[0]} by ${format_cents(abs(item[1]))}."
                     ),
                     alerts.items()
                 )
@@ -491,8 +479,8 @@ def main():
             display_monthly_insights(insights)
 
         elif choice == '7':
-            file_type = input("Enter the file type to export 'csv':").lower()
-            file_path = input("Enter the file path (including filename): ")
+            file_type = read_input("Enter the file type to export 'csv':").lower()
+            file_path = read_input("Enter the file path (including filename): ")
 
             if file_type == 'csv':
                 export_csv(transactions, file_path)
@@ -500,8 +488,8 @@ def main():
                 print("Invalid file type. Please choose 'csv'.")
 
         elif choice == '8':
-            import_choice = input("Choose import format (csv/json): ").lower()
-            file_path = input("Enter the file path to import the transactions from: ")
+            import_choice = read_input("Choose import format (csv/json): ").lower()
+            file_path = read_input("Enter the file path to import the transactions from: ")
 
             if import_choice in ['csv', 'json']:
                 transactions = add_transaction(transactions, file_path=file_path, file_type=import_choice)
@@ -510,27 +498,42 @@ def main():
                 print("Invalid choice. Please choose 'csv' or 'json'.")
 
         elif choice == '9':
-            file_path = input("Enter the file path to save the report: ")
+            file_path = read_input("Enter the file path to save the report: ")
             export_report(transactions, budgets, savings_goals, file_path)
 
         elif choice == '10':
             print("Exiting the application...")
 
+        elif choice == '11':
+            base_path = read_input("Enter the report path without extension: ")
+            formats = manual_strip(read_input("Enter formats, comma-separated (json,csv,md): ").lower()) or 'json,csv,md'
+            export_report_data(transactions, budgets, savings_goals, base_path,
+                               tuple(custom_filter(bool, custom_map(manual_strip, manual_split(formats, ',')))))
+
+        elif choice == '12':
+            file_path = read_input("Enter the file path (including filename): ")
+            export_checkpoint = export_csv_since(transactions, file_path, export_checkpoint)
+
         else:
-            print("Invalid choice. Please select a number between 1 and 9.")
+            print("Invalid choice. Please select a number between 1 and 12.")
 
-        if choice != '10':
+    while True:                     # iterative event loop, one menu action per pass
+        if interactive:
             display_menu()
-            next_choice = input("Please select an option (1-10): ")
-            process_choice(next_choice)
-
-    display_menu()
-    choice = input("Please select an option (1-10): ")
-    process_choice(choice)
+        try:
+            choice = read_input("Please select an option (1-12): ")
+            process_choice(choice)
+        except EOFError:            # end of script (or Ctrl-D) ends the session
+            choice = '10'
+            process_choice(choice)
+        except ValueError as e:     # a bad value (e.g. amount '12,50') skips this command, not the whole run
+            print(f"Invalid input, command skipped: {e}")
+        if choice == '10':
+            break
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
 
 
 
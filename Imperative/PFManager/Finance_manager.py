@@ -1,24 +1,138 @@
 import json
 import csv
+import os
+import sys
+import threading
+import time
+
+# The modules of this front-end import the shared Core package; put the repo root on the path once, here
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
 from transaction import Transaction
+from budget import Budget, PERIODS
+from instrumentation import Instrumentation, files_size, instrumented
+from cache import (AggregateCache, cached, ALL_TRANSACTIONS, BUDGETS, GOALS,
+                   category_scope, month_scope)
+from locking import ReadWriteLock, atomic_write_json, reads, writes
+from savings import SavingsAllocator
+from partitions import PartitionStore, partition_directory, partition_label, record_partition
 from collections import defaultdict
-from datetime import date, datetime 
+from contextlib import nullcontext
+from datetime import date
+from operator import attrgetter
+
+from Core.dates import parse_date, to_date
+from Core.money import parse_cents, to_units
+from Core.ledger import Ledger, EXPENSE, month_index
+from Core import queries, trends
+from Core.records import write_csv_rows
+from Core.report import build_report_model, export_report_formats, write_text_report
+
+REPORT_BUFFER_SIZE = 1 << 20  # bytes buffered before each write to the report file
+
+
+def _query_scopes(category=None, period=None):
+    """Cache scopes of a query optionally restricted to a category and/or a (year, month)."""
+    scopes = []
+    if category is not None:
+        scopes.append(category_scope(category))
+    if period is not None:
+        scopes.append(month_scope(month_index(*period)))
+    return scopes or [ALL_TRANSACTIONS]
+
+
+def _series_scopes(self, start=None, end=None, freq="month", window=3):
+    """A monthly series over a closed range only depends on the months in it."""
+    if freq != "month" or start is None or end is None:
+        return [ALL_TRANSACTIONS]
+    first, last = (month_index(d.year, d.month)
+                   for d in (to_date(v) if isinstance(v, str) else v for v in (start, end)))
+    return [month_scope(index) for index in range(first, last + 1)] or [ALL_TRANSACTIONS]
 
 
 class FinanceManager:
-    def __init__(self, data_file="transactions.json", budget_file="budgets.json", savings_file="savings_goals.json"):
+    def __init__(self, data_file="transactions.json", budget_file="budgets.json", savings_file="savings_goals.json",
+                 instrument=False, thread_safe=False, savings_rule="proportional", savings_rate=1.0,
+                 cache=True, partitioned=False, clock=date.today):
+        self.instrumentation = Instrumentation() if instrument else None  # opt-in timing of operations
+        self.cache = AggregateCache() if cache else None  # memoized aggregates, invalidated on write
+        self._lock = ReadWriteLock() if thread_safe else None  # opt-in reader-writer locking
         self.transactions = []
-        self.budgets = {}
+        self.ledger = Ledger()  # columnar mirror of self.transactions for aggregation
+        self.budgets = {}  # {category: Budget}, kept current as expenses are ingested
+        self._invalid_budgets = {}  # saved budgets that cannot be loaded; written back unless replaced
+        self.clock = clock  # returns today's date; budgets track the calendar period it falls in
+        self._budget_lock = threading.RLock()  # readers may roll budgets over concurrently
         self.savings_goals = {}  # Dictionary to store savings goals
+        self.savings_allocator = SavingsAllocator(self.savings_goals, savings_rule, savings_rate)
         self.data_file = data_file
+        # opt-in per-month storage next to data_file ('transactions.json' -> 'transactions/')
+        self.store = PartitionStore(partition_directory(data_file)) if partitioned else None
+        self._unsaved = []  # transactions ingested since the last save (appended as-is when partitioned)
+        self._next_seq = 1  # sequence number of the next transaction ingested
+        self._invalid_records = []  # saved rows that cannot be loaded; written back unchanged, never dropped
         self.budget_file = budget_file
         self.savings_file = savings_file
         self.load_transactions()
         self.load_budgets()
         self.load_savings_goals()
-        
+
+    def reading(self):
+        """
+        Context manager holding the read lock across several calls, so they
+        all see the same ledger state. A no-op unless thread_safe is on.
+        """
+        return self._lock.read_locked() if self._lock is not None else nullcontext()
+
+    def writing(self):
+        """Context manager holding the write lock across several calls (no-op unless thread_safe)."""
+        return self._lock.write_locked() if self._lock is not None else nullcontext()
+
+    def enable_instrumentation(self):
+        """Start recording call counts, timings, rows and bytes for each operation."""
+        if self.instrumentation is None:
+            self.instrumentation = Instrumentation()
+
+    def disable_instrumentation(self):
+        """Stop recording and discard collected stats."""
+        self.instrumentation = None
+
+    def performance_stats(self):
+        """Return the recorded stats as {operation: {...}}, or {} when instrumentation is off."""
+        if self.instrumentation is None:
+            return {}
+        stats = self.instrumentation.to_dict()
+        cache = parse_date.cache_info()
+        stats["date_parse_cache"] = {"kind": "cache", "hits": cache.hits, "misses": cache.misses,
+                                     "size": cache.currsize}
+        if self.cache is not None:
+            stats["result_cache"] = {"kind": "cache", **self.cache.stats()}
+        return stats
+
+    def cache_stats(self):
+        """Return the aggregate cache's hits, misses, hit rate and size, or {} when caching is off."""
+        return self.cache.stats() if self.cache is not None else {}
+
+    def _invalidate(self, *scopes):
+        """Bump the cache generation of the given scopes, or of everything when none are given."""
+        if self.cache is None:
+            return
+        if scopes:
+            self.cache.bump(*scopes)
+        else:
+            self.cache.invalidate_all()
+
+    def performance_summary(self):
+        """Return a printable table of the recorded stats."""
+        if self.instrumentation is None:
+            return "Instrumentation is disabled."
+        return self.instrumentation.summary()
     
 
+    @writes
+    @instrumented("import", rows="added")
     def import_from_csv(self, filename):
         """
         Import transaction data from a CSV file.
@@ -28,19 +142,10 @@ class FinanceManager:
         filename (str): Path to the CSV file to import.
         """
         with open(filename, 'r') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                # Assuming the CSV contains 'date', 'category', 'amount', 'transaction_type'
-                date = row['date']
-                category = row['category']
-                amount = float(row['amount'])
-                transaction_type = row['transaction_type']
-
-                # Create a Transaction object and add it to the list
-                transaction = Transaction(date, category, amount, transaction_type)
-                self.transactions.append(transaction)
-        print(f"Imported {len(self.transactions)} transactions from {filename}")
+            self._import_records(csv.DictReader(file), filename)
 
+    @writes
+    @instrumented("import", rows="added")
     def import_from_json(self, filename):
         """
         Import transaction data from a JSON file.
@@ -50,79 +155,302 @@ class FinanceManager:
         filename (str): Path to the JSON file to import.
         """
         with open(filename, 'r') as file:
-            data = json.load(file)
-            for item in data:
-                # Assuming each entry has 'date', 'category', 'amount', 'transaction_type'
+            self._import_records(json.load(file), filename)
+
+    @writes
+    @instrumented("import", rows="added")
+    def import_records(self, records, source="input"):
+        """
+        Import transactions from an iterable of dicts (e.g. a csv.DictReader over stdin).
+
+        Args:
+        records (iterable): Dicts with 'date', 'category', 'amount', 'transaction_type'.
+        source (str): Name of the input, used in the confirmation message.
+        """
+        self._import_records(records, source)
+
+    def _import_records(self, records, source):
+        """Build and check every record first, so an invalid one (ValueError) imports nothing."""
+        transactions = []
+        for item in records:
+            # Assuming each entry has 'date', 'category', 'amount', 'transaction_type'
+            try:
                 date = item['date']
                 category = item['category']
-                amount = float(item['amount'])
+                amount = item['amount']  # parsed straight to cents by Transaction
                 transaction_type = item['transaction_type']
+            except (KeyError, TypeError):
+                raise ValueError(f"Invalid transaction record in {source}: {item!r}")
+
+            # Create a Transaction object and add it to the list
+            transaction = Transaction(date, category, amount, transaction_type)
+            self.check_transaction(transaction)
+            transactions.append(transaction)
+        for transaction in transactions:
+            self._ingest(transaction)
+        print(f"Imported {len(self.transactions)} transactions from {source}")
+
+    @staticmethod
+    def check_transaction(transaction):
+        """
+        Raise ValueError if a transaction cannot go into the ledger, before
+        anything is changed: an impossible date (e.g. 2024-02-30), a type that
+        is not text, or an amount beyond the ledger's 64-bit cents.
 
-                # Create a Transaction object and add it to the list
-                transaction = Transaction(date, category, amount, transaction_type)
-                self.transactions.append(transaction)
-        print(f"Imported {len(self.transactions)} transactions from {filename}")
-
-    def load_transactions(self):
-        """Load transactions from the JSON file."""
+        :return: The transaction's date as a datetime.date.
+        """
         try:
-            with open(self.data_file, "r") as file:
-                data = json.load(file)
-                self.transactions = [Transaction.from_dict(t) for t in data]
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.transactions = []
+            day = to_date(transaction.date)
+        except (AttributeError, TypeError, ValueError):
+            raise ValueError(f"Invalid date: {transaction.date!r}")
+        if not isinstance(transaction.transaction_type, str):
+            raise ValueError(f"Invalid transaction type: {transaction.transaction_type!r}")
+        if not -(1 << 63) <= transaction.cents < 1 << 63:
+            raise ValueError(f"Amount out of range: {transaction.amount}")
+        return day
+
+    def _ingest(self, transaction):
+        """Number a transaction and append it to both the object list and the columnar ledger."""
+        day = self.check_transaction(transaction)
+        if transaction.category in self.budgets:
+            self._roll_budgets()  # before the row is in the ledger, so a reseed cannot count it twice
+        transaction.seq = self._next_seq
+        self._next_seq += 1
+        self.transactions.append(transaction)
+        self.ledger.append(transaction.date, transaction.category, transaction.cents, transaction.transaction_type)
+        self._unsaved.append(transaction)
+        budget = self.budgets.get(transaction.category)
+        if budget is not None and self.ledger.kinds[-1] == EXPENSE:
+            budget.add_expense(transaction.cents, day)
+        self._invalidate(ALL_TRANSACTIONS, category_scope(transaction.category), month_scope(self.ledger.months[-1]))
+
+    @writes
+    @instrumented("load")
+    def load_transactions(self):
+        """
+        Load transactions from the JSON file, or from every partition when partitioned.
+
+        The first partitioned load of an existing monolithic file splits it
+        into partitions; the file itself is left in place. Transactions saved
+        without a sequence number are numbered here (see _number_transactions);
+        partitions holding any are rewritten at once so the numbers stay put.
+
+        Saved rows that cannot be loaded (e.g. a date such as '12/13/2024')
+        are left out of the ledger but kept as they are, and every save or
+        rewrite writes them back.
+        """
+        self._invalid_records = []
+        if self.store is not None and self.store.exists():
+            self.transactions = self._load_records(self.store.load(), self.store.directory)
+            numbered = self._number_transactions()
+            if numbered:
+                months = {partition_label(t.date) for t in numbered}
+                self.store.rewrite([t.to_dict() for t in self.transactions if partition_label(t.date) in months]
+                                   + [r for r in self._invalid_records if record_partition(r) in months])
+        else:
+            try:
+                with open(self.data_file, "r") as file:
+                    data = json.load(file)
+                    self.transactions = self._load_records(data, self.data_file)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self.transactions = []
+            self._number_transactions()  # stable in file order; persisted by the next save
+            if self.store is not None:
+                self.store.append([t.to_dict() for t in self.transactions] + self._invalid_records)
+        self._unsaved = []
+        self._rebuild_ledger()
+
+    def _load_records(self, records, source):
+        """Transactions from saved dicts; rows that cannot be loaded are set aside in self._invalid_records."""
+        transactions = []
+        for record in records:
+            try:
+                transaction = Transaction.from_dict(record)
+                self.check_transaction(transaction)
+            except (KeyError, TypeError, ValueError):
+                self._invalid_records.append(record)
+                continue
+            transactions.append(transaction)
+        if self._invalid_records:
+            print(f"{len(self._invalid_records)} invalid transactions in {source} are left out of the totals "
+                  f"(kept in the file unchanged)")
+        return transactions
+
+    def _number_transactions(self):
+        """
+        Number loaded transactions that have no sequence number (saved before
+        there were any), after the highest existing one and in load order, then
+        order self.transactions by sequence number.
+
+        Partitions load month by month, so sorting restores the order the
+        transactions were added in, which changes_since() relies on.
 
+        :return: The transactions numbered.
+        """
+        last = max((t.seq for t in self.transactions if t.seq is not None), default=0)
+        numbered = [t for t in self.transactions if t.seq is None]
+        for t in numbered:
+            last += 1
+            t.seq = last
+        self.transactions.sort(key=attrgetter("seq"))
+        self._next_seq = last + 1
+        return numbered
+
+    @instrumented("load")
+    def _rebuild_ledger(self):
+        """Rebuild the columnar ledger (parsing every date) from self.transactions."""
+        self.ledger = Ledger.from_transactions(self.transactions)
+        self._seed_budgets(self.budgets.values())
+        self._invalidate()
+
+    def _seed_budgets(self, budgets):
+        """Start budgets on the clock's current period and replay its expenses from the ledger, in one pass."""
+        today = self.clock()
+        by_id = {}
+        for budget in budgets:
+            budget.start_window(today)
+            cid = self.ledger.find_category(budget.category)
+            if cid is not None:
+                by_id[cid] = budget
+        if not by_id:
+            return
+        for day, cid, cents, kind in zip(self.ledger.dates, self.ledger.category_ids,
+                                         self.ledger.amounts, self.ledger.kinds):
+            if kind == EXPENSE and cid in by_id:
+                by_id[cid].add_expense(cents, to_date(day))
+
+    def _roll_budgets(self):
+        """
+        Move budgets whose period has ended (by the clock) on to the current
+        one, replaying any expenses already in it. Called before budgets are
+        read or charged, so a new period starts at zero even with no spending yet.
+        """
+        with self._budget_lock:
+            today = self.clock()
+            stale = [budget for budget in self.budgets.values() if not budget.is_current(today)]
+            if stale:
+                self._seed_budgets(stale)
+                self._invalidate(BUDGETS)
+
+    @writes
+    @instrumented("save", written=lambda size: size)
     def save_transactions(self):
-        """Save all transactions to the JSON file."""
-        with open(self.data_file, "w") as file:
-            json.dump([t.to_dict() for t in self.transactions], file, indent=4)
+        """
+        Save all transactions to the JSON file. When partitioned, only the
+        transactions added since the last save are appended, each to its month.
 
+        :return: Bytes written: the size of the file, or of what was appended to the partition logs.
+        """
+        if self.store is not None:
+            size = self.store.append([t.to_dict() for t in self._unsaved])
+        else:
+            atomic_write_json(self.data_file, [t.to_dict() for t in self.transactions] + self._invalid_records)
+            size = os.path.getsize(self.data_file)
+        self._unsaved = []
+        return size
+
+    def has_unsaved_changes(self):
+        """True if transactions were added since the last load or save (budgets and goals save on every change)."""
+        return bool(self._unsaved)
+
+    @writes
+    @instrumented("save", rows=None)
+    def compact_partitions(self, before=None):
+        """
+        Compact finished month partitions and cache their totals (see partitions.PartitionStore).
+
+        :param before: 'YYYY-MM'; months before it are compacted (default: the current month).
+        :return: Labels of the partitions compacted.
+        """
+        if self.store is None:
+            print("Transactions are not partitioned; nothing to compact.")
+            return []
+        self.save_transactions()
+        return self.store.compact(before)
+
+    @writes
+    @instrumented("load", rows=None)
     def load_budgets(self):
-        """Load budgets from the JSON file."""
+        """Load budgets from the JSON file, setting aside (and reporting) entries that cannot be loaded."""
+        self.budgets, self._invalid_budgets = {}, {}
         try:
             with open(self.budget_file, "r") as file:
-                self.budgets = json.load(file)
+                saved = json.load(file)
         except (FileNotFoundError, json.JSONDecodeError):
-            self.budgets = {}
-
+            saved = {}
+        for category, data in (saved.items() if isinstance(saved, dict) else ()):
+            try:
+                self.budgets[category] = Budget.from_dict(category, data)
+            except (KeyError, TypeError, ValueError):
+                self._invalid_budgets[category] = data
+        if self._invalid_budgets:
+            print(f"{len(self._invalid_budgets)} invalid budgets in {self.budget_file} are not tracked "
+                  f"(kept in the file unchanged): {', '.join(map(str, self._invalid_budgets))}")
+        self._seed_budgets(self.budgets.values())
+        self._invalidate(BUDGETS)
+
+    @writes
+    @instrumented("save", path=lambda self: self.budget_file, rows=None)
     def save_budgets(self):
         """Save all budgets to the JSON file."""
-        with open(self.budget_file, "w") as file:
-            json.dump(self.budgets, file, indent=4)
+        saved = dict(self._invalid_budgets)  # a budget set again for the category replaces its invalid entry
+        saved.update((category, b.to_dict()) for category, b in self.budgets.items())
+        atomic_write_json(self.budget_file, saved)
 
+    @writes
     def set_budget(self, category, amount, period="monthly"):
-        """Set a budget for a specific category."""
-        if period not in ["monthly", "weekly"]:
+        """Set a budget for a specific category, tracking its current period from existing expenses."""
+        if period not in PERIODS:
             print("Invalid period. Please use 'monthly' or 'weekly'.")
             return
 
-        self.budgets[category] = {"amount": amount, "period": period}
+        budget = Budget(category, amount, period)
+        self._seed_budgets([budget])
+        self.budgets[category] = budget
+        self._invalidate(BUDGETS)
         self.save_budgets()
         print(f"Budget for {category} set to ${amount} per {period}.")
 
+    @reads
+    @instrumented("aggregate", rows=None)
     def track_budget_utilization(self, category, period="monthly"):
-        """Track budget utilization for a category."""
+        """Track budget utilization for a category in its current period."""
         if category not in self.budgets:
             print(f"No budget set for category: {category}")
             return 0.0
-
-        # Sum expenses for this category
-        total_expenses = sum(t.amount for t in self.transactions if t.category == category and t.transaction_type == "Expense")
-        
-        budget = self.budgets[category]["amount"]
-        utilization = (total_expenses / budget) * 100 if budget > 0 else 0.0
-        return utilization
-
+        with self._budget_lock:
+            self._roll_budgets()
+            return self.budgets[category].utilization()
+
+    @reads
+    def remaining_budget(self, category):
+        """Return what is left of a category's budget in its current period, or None without a budget."""
+        budget = self.budgets.get(category)
+        if budget is None:
+            return None
+        with self._budget_lock:
+            self._roll_budgets()
+            return budget.remaining_budget()
+
+    @reads
+    def budget_status(self):
+        """Return {category: Budget.status()} for every budget, in the clock's current period."""
+        with self._budget_lock:
+            self._roll_budgets()
+            return {category: budget.status() for category, budget in self.budgets.items()}
+
+    @reads
     def check_budget_alerts(self, category):
         """Check if the budget limit is nearing for a category."""
         utilization = self.track_budget_utilization(category)
-        budget = self.budgets.get(category, {}).get("amount", 0)
 
         if utilization > 90:
             print(f"Warning: You have used {utilization:.2f}% of your {category} budget!")
         elif utilization > 75:
             print(f"Alert: You have used {utilization:.2f}% of your {category} budget.")
 
+    @writes
+    @instrumented("load", rows=None)
     def load_savings_goals(self):
         """Load savings goals from the JSON file."""
         try:
@@ -130,56 +458,88 @@ class FinanceManager:
                 self.savings_goals = json.load(file)
         except (FileNotFoundError, json.JSONDecodeError):
             self.savings_goals = {}
+        self.savings_allocator.goals = self.savings_goals
+        self._invalidate(GOALS)
 
+    @writes
+    @instrumented("save", path=lambda self: self.savings_file, rows=None)
     def save_savings_goals(self):
         """Save all savings goals to the JSON file."""
-        with open(self.savings_file, "w") as file:
-            json.dump(self.savings_goals, file, indent=4)
+        atomic_write_json(self.savings_file, self.savings_goals)
+
+    @writes
+    def set_savings_goal(self, goal_name, target_amount, months_to_save, priority=None, monthly_amount=None):
+        """
+        Set a savings goal with a target amount and time frame (in months).
 
-    def set_savings_goal(self, goal_name, target_amount, months_to_save):
-        """Set a savings goal with a target amount and time frame (in months)."""
-        self.savings_goals[goal_name] = {
-            "target_amount": target_amount,
+        :param priority: Optional rank for the 'priority' and 'fixed' rules (lower is funded first).
+        :param monthly_amount: Optional fixed monthly contribution for the 'fixed' rule.
+        """
+        goal = {
+            "target_amount": to_units(parse_cents(target_amount)),
             "months_to_save": months_to_save,
-            "saved_amount": 0  # Start with no savings
+            "saved_amount": 0,  # Start with no savings
+            "contributions": {}  # {'YYYY-MM': amount} allocated from income
         }
+        if priority is not None:
+            goal["priority"] = priority
+        if monthly_amount is not None:
+            goal["monthly_amount"] = to_units(parse_cents(monthly_amount))
+        self.savings_goals[goal_name] = goal
+        self._invalidate(GOALS)
         self.save_savings_goals()
         print(f"Savings goal for '{goal_name}' set to ${target_amount} in {months_to_save} months.")
 
+    @writes
+    def set_savings_rule(self, rule, savings_rate=None):
+        """
+        Choose how income is allocated to savings goals.
+
+        :param rule: 'proportional', 'priority' or 'fixed' (see savings.SavingsAllocator).
+        :param savings_rate: Optional fraction of income set aside for goals.
+        """
+        self.savings_allocator = SavingsAllocator(
+            self.savings_goals, rule,
+            self.savings_allocator.savings_rate if savings_rate is None else savings_rate
+        )
+
+    def _allocate_savings(self, transactions):
+        """Allocate the income in transactions to the goals and save them once."""
+        contributed = self.savings_allocator.allocate_transactions(transactions)
+        if contributed:
+            self._invalidate(GOALS)
+            self.save_savings_goals()
+        return contributed
+
+    @reads
     def track_savings_progress(self, goal_name):
         """Track progress towards a savings goal."""
         if goal_name not in self.savings_goals:
             print(f"No savings goal set for '{goal_name}'.")
             return
 
-        saved_amount = self.savings_goals[goal_name]["saved_amount"]
-        target_amount = self.savings_goals[goal_name]["target_amount"]
-        remaining_amount = target_amount - saved_amount
-        print(f"Progress for goal '{goal_name}': ${saved_amount} saved, ${remaining_amount} remaining.")
+        saved_amount, remaining_amount = self.savings_allocator.progress(goal_name)
+        print(f"Progress for goal '{goal_name}': ${saved_amount:.2f} saved, ${remaining_amount:.2f} remaining.")
+        return saved_amount, remaining_amount
 
+    @reads
     def recommend_monthly_savings(self, goal_name):
         """Recommend how much to save monthly to reach the savings goal on time."""
         if goal_name not in self.savings_goals:
             print(f"No savings goal set for '{goal_name}'.")
             return
 
-        goal = self.savings_goals[goal_name]
-        target_amount = goal["target_amount"]
-        months_to_save = goal["months_to_save"]
-        
-        monthly_savings = target_amount / months_to_save
+        monthly_savings = self.savings_allocator.recommended_monthly(goal_name)
         print(f"To reach the goal '{goal_name}', you need to save ${monthly_savings:.2f} each month.")
         return monthly_savings       
 
+    @reads
+    @instrumented("aggregate")
     def generate_spending_summary(self, period="monthly"):
         """Generate a summary of spending based on the specified period (monthly or weekly)."""
-        total_spent = 0
-        category_spending = defaultdict(float)
-
-        for transaction in self.transactions:
-            if transaction.transaction_type == "Expense":
-                total_spent += transaction.amount
-                category_spending[transaction.category] += transaction.amount
+        totals = self._expense_totals()
+        category_spending = defaultdict(float, {category: to_units(cents) for category, cents in totals.items()})
+        total_spent = to_units(sum(totals.values()))
 
         print(f"Total Spending ({period}): ${total_spent:.2f}")
         print("Spending by Category:")
@@ -188,6 +548,13 @@ class FinanceManager:
         
         return total_spent, category_spending
 
+    @cached(lambda self: [ALL_TRANSACTIONS])
+    def _expense_totals(self):
+        """{category: total expenses in cents}; cached until any transaction is added."""
+        return self.ledger.category_totals(EXPENSE)
+
+    @reads
+    @instrumented("aggregate")
     def generate_spending_trends(self, year1, month1, year2, month2):
         """
         Generate insights into spending trends for two specific months.
@@ -198,28 +565,18 @@ class FinanceManager:
             year2 (int): Year of the second month (e.g., 2024).
             month2 (int): Month of the second period (1-12).
         """
-        from calendar import monthrange
-
-        # Calculate start and end dates for the two periods
+        # Validate the two periods (raises ValueError for an invalid month)
         start_date1 = date(year1, month1, 1)
-        end_date1 = date(year1, month1, monthrange(year1, month1)[1])
-
         start_date2 = date(year2, month2, 1)
-        end_date2 = date(year2, month2, monthrange(year2, month2)[1])
-
-        # Filter transactions for the two periods
-        period1_transactions = [
-            t for t in self.transactions
-            if t.transaction_type == "Expense" and start_date1 <= datetime.strptime(t.date, "%Y-%m-%d").date() <= end_date1
-        ]
-        period2_transactions = [
-            t for t in self.transactions
-            if t.transaction_type == "Expense" and start_date2 <= datetime.strptime(t.date, "%Y-%m-%d").date() <= end_date2
-        ]
+
+        # Aggregate expenses for both periods in a single pass
+        monthly = self._month_category_totals(month_index(year1, month1), month_index(year2, month2))
+        period1_totals = monthly.get((year1, month1), {})
+        period2_totals = monthly.get((year2, month2), {})
 
         # Calculate spending for each period
-        spending_period1 = sum(t.amount for t in period1_transactions)
-        spending_period2 = sum(t.amount for t in period2_transactions)
+        spending_period1 = to_units(sum(period1_totals.values()))
+        spending_period2 = to_units(sum(period2_totals.values()))
 
         print(f"Total Spending for {start_date1.strftime('%B %Y')}: ${spending_period1:.2f}")
         print(f"Total Spending for {start_date2.strftime('%B %Y')}: ${spending_period2:.2f}")
@@ -228,12 +585,10 @@ class FinanceManager:
         period1_category_spending = defaultdict(float)
         period2_category_spending = defaultdict(float)
 
-        for t in period1_transactions:
-            normalized_category = t.category.lower()  # Normalize category names
-            period1_category_spending[normalized_category] += t.amount
-        for t in period2_transactions:
-            normalized_category = t.category.lower()  # Normalize category names
-            period2_category_spending[normalized_category] += t.amount
+        for category, cents in period1_totals.items():
+            period1_category_spending[category.lower()] += cents  # Normalize category names
+        for category, cents in period2_totals.items():
+            period2_category_spending[category.lower()] += cents
 
         print("\nSpending Trends by Category:")
         for category in period1_category_spending.keys() | period2_category_spending.keys():
@@ -254,35 +609,124 @@ class FinanceManager:
 
             print(f"{category.capitalize()}: {trend}")
 
+    @cached(lambda self, *months: [month_scope(index) for index in months])
+    def _month_category_totals(self, *months):
+        """{(year, month): {category: expenses in cents}} for the given month indices; cached per month."""
+        return self.ledger.month_category_totals(EXPENSE, months=set(months))
+
+    @writes
     def add_transaction(self, transaction):
         """Add a transaction and save it to the file."""
-        self.transactions.append(transaction)
+        self._ingest(transaction)
         self.save_transactions()
         print("Transaction added successfully!")
         # Check if budget alerts are needed
         self.check_budget_alerts(transaction.category)
         if transaction.transaction_type == "Income":
-            for goal_name, goal in self.savings_goals.items():
-                if goal["saved_amount"] < goal["target_amount"]:
-                    goal["saved_amount"] += transaction.amount
-                    self.save_savings_goals()
-                    print(f"Updated savings for goal '{goal_name}': ${goal['saved_amount']}")
+            for goal_name, amount in self._allocate_savings([transaction]).items():
+                print(f"Updated savings for goal '{goal_name}': +${amount:.2f}, "
+                      f"${self.savings_goals[goal_name]['saved_amount']:.2f} saved")
+
+    @writes
+    @instrumented("import", rows="added")
+    def add_transactions(self, transactions):
+        """
+        Add several transactions with a single save of each file.
 
+        Used for batched ingestion; budget alerts are checked once per
+        affected category. Every transaction is checked first, so an invalid
+        one rejects the whole batch without adding any.
+        """
+        for transaction in transactions:
+            self.check_transaction(transaction)
+        for transaction in transactions:
+            self._ingest(transaction)
+        self.save_transactions()
+        for category in dict.fromkeys(t.category for t in transactions):
+            self.check_budget_alerts(category)
+        self._allocate_savings(transactions)
 
+    @reads
+    @instrumented("aggregate")
     def calculate_summary(self):
         """Calculate total income, total expenses, and balance."""
-        total_income = sum(t.amount for t in self.transactions if t.transaction_type == "Income")
-        total_expense = sum(t.amount for t in self.transactions if t.transaction_type == "Expense")
+        total_income, total_expense = self._totals()
         balance = total_income - total_expense
-        return total_income, total_expense, balance
+        return to_units(total_income), to_units(total_expense), to_units(balance)
+
+    @cached(lambda self: [ALL_TRANSACTIONS])
+    def _totals(self):
+        """(total income, total expenses) in cents; cached until any transaction is added."""
+        return self.ledger.totals()
 
+    @reads
+    @instrumented("aggregate")
+    @cached(lambda self: [ALL_TRANSACTIONS])
     def category_breakdown(self):
         """Provide a breakdown of spending and income by category."""
         breakdown = defaultdict(lambda: {"Income": 0, "Expense": 0})
-        for t in self.transactions:
-            breakdown[t.category][t.transaction_type] += t.amount
+        for category, (income, expense) in self.ledger.category_breakdown().items():
+            breakdown[category] = {"Income": to_units(income), "Expense": to_units(expense)}
         return breakdown
 
+    @reads
+    @instrumented("aggregate")
+    @cached(_series_scopes)
+    def spending_trend_series(self, start=None, end=None, freq="month", window=3):
+        """
+        Spending time series for every category over a date range, in one pass.
+
+        :param start: First date to include ('YYYY-MM-DD' or datetime.date); default: earliest expense.
+        :param end: Last date to include; default: latest expense.
+        :param freq: 'month' for month-over-month or 'week' for week-over-week.
+        :param window: Number of periods in the rolling average.
+        :return: {"periods": [...], "total": {...}, "categories": {category: {...}}}, each
+                 series holding "values", "change_pct" and "rolling_avg" lists.
+        """
+        return trends.spending_series(self.ledger, start, end, freq, window)
+
+    @reads
+    @instrumented("aggregate")
+    def top_expenses(self, n=10, category=None, period=None):
+        """
+        Return the n largest expense transactions, largest first.
+
+        :param n: Number of transactions to return.
+        :param category: Optional category to restrict to.
+        :param period: Optional (year, month) to restrict to.
+        """
+        return [self.transactions[i] for i in queries.top_expenses(self.ledger, n, category, period)]
+
+    @reads
+    @instrumented("aggregate")
+    @cached(lambda self, n=5: [ALL_TRANSACTIONS])
+    def top_categories(self, n=5):
+        """Return the n categories with the highest spending as [(category, total)]."""
+        return [(category, to_units(cents)) for category, cents in queries.top_categories(self.ledger, n)]
+
+    @reads
+    @instrumented("aggregate")
+    @cached(lambda self, percentiles=None, by=None, category=None, period=None: _query_scopes(category, period))
+    def spending_percentiles(self, percentiles=(25, 50, 75, 90), by="category", category=None, period=None):
+        """
+        Compute percentiles of expense amounts per category and/or month.
+
+        :param percentiles: Percentiles to compute (0-100).
+        :param by: 'category', 'month', 'category_month', or None for all expenses together.
+        :param category: Optional category to restrict to.
+        :param period: Optional (year, month) to restrict to.
+        :return: {group: {percentile: value}}
+        """
+        result = queries.spending_percentiles(self.ledger, percentiles, by, category, period)
+        return {group: {q: to_units(cents) if cents is not None else None for q, cents in values.items()}
+                for group, values in result.items()}
+
+    def spending_median(self, by="category", category=None, period=None):
+        """Return the median expense amount per group, as {group: median}."""
+        result = self.spending_percentiles((50,), by, category, period)
+        return {group: values[50] for group, values in result.items()}
+
+    @reads
     def show_transactions(self):
         """Display all transactions."""
         if not self.transactions:
@@ -293,84 +737,127 @@ class FinanceManager:
             print("-" * 50)
             for t in self.transactions:
                 print(f"{t.date:<12} {t.category:<15} {t.transaction_type:<10} ${t.amount:>8.2f}")
+
+    @reads
+    def changes_since(self, checkpoint=0):
+        """
+        Transactions added after a checkpoint, oldest first.
+
+        self.transactions is ordered by sequence number, so the first new one
+        is found by binary search and the cost scales with the number of
+        changes, not with the size of the ledger.
+
+        :param checkpoint: Sequence number returned by the previous export (0 for everything).
+        """
+        start, end = 0, len(self.transactions)
+        while start < end:  # bisect_right by seq, written out since bisect's key= needs Python 3.10
+            middle = (start + end) // 2
+            if self.transactions[middle].seq <= checkpoint:
+                start = middle + 1
+            else:
+                end = middle
+        return self.transactions[start:]
+
+    def _report_model(self):
+        """The report model; shared read-only by every export until a write or a budget rollover invalidates it."""
+        self._roll_budgets()
+        return self._build_report_model()
+
+    @cached(lambda self: [ALL_TRANSACTIONS, BUDGETS, GOALS], copy_result=False)
+    def _build_report_model(self):
+        return build_report_model(self.ledger, self.budget_status(), self.savings_goals)
+
+    @reads
+    @instrumented("report", path=lambda self, filename="financial_report.txt": filename)
     def export_financial_report(self, filename="financial_report.txt"):
         """
         Generate a comprehensive financial report and export it to a text file.
 
+        Every section is computed from one scan of the ledger and streamed to
+        the file through a large write buffer.
+
         :param filename: Name of the file to export the report to (default: financial_report.txt)
+        :return: Seconds taken to build and write the report, or None on error.
         """
+        start = time.perf_counter()
         try:
-            with open(filename, "w") as report_file:
-                # Financial Summary
-                total_income, total_expense, balance = self.calculate_summary()
-                report_file.write("=== FINANCIAL SUMMARY ===\n")
-                report_file.write(f"Total Income:   ${total_income:.2f}\n")
-                report_file.write(f"Total Expenses: ${total_expense:.2f}\n")
-                report_file.write(f"Current Balance: ${balance:.2f}\n\n")
-
-                # Category Breakdown
-                report_file.write("=== CATEGORY BREAKDOWN ===\n")
-                category_breakdown = self.category_breakdown()
-                for category, values in category_breakdown.items():
-                    report_file.write(f"{category}:\n")
-                    report_file.write(f"  Income:   ${values['Income']:.2f}\n")
-                    report_file.write(f"  Expense:  ${values['Expense']:.2f}\n")
-                report_file.write("\n")
-
-                # Budgets
-                report_file.write("=== BUDGET STATUS ===\n")
-                for category, budget_details in self.budgets.items():
-                    utilization = self.track_budget_utilization(category)
-                    report_file.write(f"{category} Budget:\n")
-                    report_file.write(f"  Budget Amount: ${budget_details['amount']:.2f} ({budget_details['period']})\n")
-                    report_file.write(f"  Utilization:   {utilization:.2f}%\n")
-                report_file.write("\n")
-
-                # Savings Goals
-                report_file.write("=== SAVINGS GOALS ===\n")
-                for goal_name, goal_details in self.savings_goals.items():
-                    report_file.write(f"{goal_name}:\n")
-                    report_file.write(f"  Target Amount: ${goal_details['target_amount']:.2f}\n")
-                    report_file.write(f"  Months to Save: {goal_details['months_to_save']}\n")
-                    report_file.write(f"  Current Savings: ${goal_details['saved_amount']:.2f}\n")
-                    remaining = goal_details['target_amount'] - goal_details['saved_amount']
-                    report_file.write(f"  Remaining to Save: ${remaining:.2f}\n")
-                report_file.write("\n")
-
-                # Recent Transactions (last 10)
-                report_file.write("=== RECENT TRANSACTIONS ===\n")
-                sorted_transactions = sorted(self.transactions, key=lambda x: x.date, reverse=True)
-                for t in sorted_transactions[:10]:  # Last 10 transactions
-                    report_file.write(f"{t.date} | {t.category} | {t.transaction_type}: ${t.amount:.2f}\n")
-
-                # Spending Summary
-                report_file.write("\n=== MONTHLY SPENDING SUMMARY ===\n")
-                total_spent, category_spending = self.generate_spending_summary()
-                for category, amount in category_spending.items():
-                    report_file.write(f"{category}: ${amount:.2f}\n")
-
+            model = self._report_model()
+            with open(filename, "w", buffering=REPORT_BUFFER_SIZE) as report_file:
+                write_text_report(model, report_file)
         except IOError as e:
             print(f"Error exporting report: {e}")
-        else:
-            print(f"Financial report exported successfully to {filename}")
+            return None
+        elapsed = time.perf_counter() - start
+        print(f"Financial report exported successfully to {filename} in {elapsed * 1000:.1f} ms")
+        return elapsed
+
+    @reads
+    @instrumented("report", written=lambda paths: files_size(paths.values()))
+    def export_report_formats(self, base_path="financial_report", formats=("txt", "json", "csv", "md")):
+        """
+        Compute the financial report once and write it in several formats.
+
+        :param base_path: Output path without extension; each format adds its own.
+        :param formats: Any of 'txt', 'json', 'csv' and 'md'.
+        :return: {format: path written}, or {} on error.
+        """
+        try:
+            model = self._report_model()
+            written = export_report_formats(model, base_path, formats, buffering=REPORT_BUFFER_SIZE)
+        except (IOError, ValueError) as e:
+            print(f"Error exporting report: {e}")
+            return {}
+        for path in written.values():
+            print(f"Financial report exported successfully to {path}")
+        return written
+
+    @reads
+    @instrumented("report", path=lambda self, filename, since=0: filename, rows=None)
+    def export_changes(self, filename, since=0):
+        """
+        Export only the transactions added after a checkpoint, for incremental syncs.
+
+        Rows carry their sequence number ('seq'). A '.csv' filename writes CSV
+        with the columns import_from_csv reads, anything else a JSON list like
+        the transactions file.
+
+        :param filename: File to write; written even when there are no changes.
+        :param since: Checkpoint returned by the previous export (0 for everything).
+        :return: The new checkpoint (the last sequence number exported, or since
+                 when nothing was added), or None on error.
+        """
+        changes = self.changes_since(since)
+        try:
+            if filename.lower().endswith(".csv"):
+                with open(filename, "w", newline="") as file:
+                    write_csv_rows(file, ({**t.to_dict(), "amount": t.cents} for t in changes),
+                                   ("seq", "date", "category", "amount", "transaction_type"))
+            else:
+                atomic_write_json(filename, [t.to_dict() for t in changes])
+        except IOError as e:
+            print(f"Error exporting changes: {e}")
+            return None
+        print(f"Exported {len(changes)} new transactions to {filename}")
+        return changes[-1].seq if changes else since
 
 
 
 
+    @reads
+    @instrumented("aggregate")
     def get_balance(self):
         
-        balance = 0
-        for transaction in self.transactions:
-            if transaction.transaction_type == "Income":
-                balance += transaction.amount
-            elif transaction.transaction_type == "Expense":
-                balance -= transaction.amount
-        return balance
+        total_income, total_expense = self._totals()
+        return to_units(total_income - total_expense)
     
+    @reads
+    @instrumented("aggregate")
     def get_total_income(self):
-        total_income = sum(t.amount for t in self.transactions if t.transaction_type == "Income")
-        return total_income
+        total_income, _ = self._totals()
+        return to_units(total_income)
     
+    @reads
+    @instrumented("aggregate")
     def get_total_expenses(self):
-        total_expenses = sum(t.amount for t in self.transactions if t.transaction_type == "Expense")
-        return total_expenses
\ No newline at end of file
+        _, total_expenses = self._totals()
+        return to_units(total_expenses)
\ No newline at end of file
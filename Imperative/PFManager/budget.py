@@ -1,3 +1,17 @@
+from datetime import timedelta
+
+from Core.money import parse_cents, to_units
+
+PERIODS = ("monthly", "weekly")
+
+
+def window_start(day, period):
+    """First day of the budget window containing day: the 1st of its month, or its Monday."""
+    if period == "monthly":
+        return day.replace(day=1)
+    return day - timedelta(days=day.weekday())
+
+
 class Budget:
     def __init__(self, category, amount, period):
         """
@@ -7,19 +21,73 @@ class Budget:
         :param amount: The total amount allocated for this category.
         :param period: The time period for the budget ('monthly' or 'weekly').
         """
+        if period not in PERIODS:
+            raise ValueError("Invalid period. Please use 'monthly' or 'weekly'.")
         self.category = category
-        self.amount = amount
+        self.amount_cents = parse_cents(amount)
         self.period = period
-        self.spent = 0  # Track how much has been spent in this category
+        self.spent_cents = 0  # Track how much has been spent in this category
+        self.window = None  # datetime.date starting the period being tracked (see start_window)
+
+    @property
+    def amount(self):
+        return to_units(self.amount_cents)
+
+    @property
+    def spent(self):
+        return to_units(self.spent_cents)
+
+    def start_window(self, today):
+        """Start tracking the calendar period containing today (a datetime.date), with nothing spent."""
+        self.window = window_start(today, self.period)
+        self.spent_cents = 0
 
-    def add_expense(self, amount):
-        """Add an expense to the category and update the spent amount."""
-        self.spent += amount
+    def is_current(self, today):
+        """True if the period being tracked is the one containing today."""
+        return self.window == window_start(today, self.period)
+
+    def add_expense(self, cents, day=None):
+        """
+        Add an expense (in integer cents) to the category and update the spent amount.
+
+        Once a window is being tracked, an expense dated (datetime.date) in
+        any other period is ignored.
+
+        :return: True if the expense counted towards the current period.
+        """
+        if day is not None and self.window is not None and window_start(day, self.period) != self.window:
+            return False
+        self.spent_cents += cents
+        return True
 
     def remaining_budget(self):
         """Calculate remaining budget."""
-        return self.amount - self.spent
+        return to_units(self.amount_cents - self.spent_cents)
+
+    def utilization(self):
+        """Percentage of the budget spent in the current period."""
+        return (self.spent_cents / self.amount_cents) * 100 if self.amount_cents > 0 else 0.0
 
     def is_nearing_limit(self, threshold=0.9):
         """Check if the budget is nearing the limit (default 90% utilization)."""
-        return self.spent >= self.amount * threshold
+        return self.spent_cents >= self.amount_cents * threshold
+
+    def status(self):
+        """Current state of the budget as a plain dict (for reports and JSON output)."""
+        return {
+            "amount": self.amount,
+            "period": self.period,
+            "window": self.window.isoformat() if self.window else None,
+            "spent": self.spent,
+            "remaining": self.remaining_budget(),
+            "utilization": self.utilization(),
+        }
+
+    def to_dict(self):
+        """Convert the Budget into a dictionary for JSON saving (spending is derived from transactions)."""
+        return {"amount": self.amount, "period": self.period}
+
+    @classmethod
+    def from_dict(cls, category, data):
+        """Create a Budget from its saved dictionary."""
+        return cls(category, data["amount"], data["period"])
@@ -0,0 +1,111 @@
+import copy
+import functools
+import threading
+
+ALL_TRANSACTIONS = ("transactions",)
+BUDGETS = ("budgets",)
+GOALS = ("goals",)
+
+
+def category_scope(category):
+    return ("category", category)
+
+
+def month_scope(index):
+    """Scope of one month, identified by its Core.ledger.month_index()."""
+    return ("month", index)
+
+
+class AggregateCache:
+    def __init__(self):
+        """
+        Generation-numbered result cache for FinanceManager aggregates.
+
+        Every piece of state an aggregate can depend on is a *scope*: all
+        transactions, one category, one month, the budgets, the savings
+        goals. Each scope has a generation number that writes bump.
+        A cached entry remembers the generations of the scopes it depends on
+        and is served only while all of them are unchanged, so a write
+        invalidates exactly the entries that read what it changed.
+        """
+        self._generations = {}
+        self._entries = {}
+        self._epoch = 0  # bumped by invalidate_all()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _snapshot(self, scopes):
+        generations = self._generations
+        return (self._epoch,) + tuple(generations.get(scope, 0) for scope in scopes)
+
+    def bump(self, *scopes):
+        """Mark the given scopes as changed."""
+        with self._lock:
+            for scope in scopes:
+                self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    def invalidate_all(self):
+        """Drop every cached entry (e.g. after reloading a file)."""
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def get_or_compute(self, key, scopes, compute):
+        """Return the cached value for key if its scopes are unchanged, else compute and store it."""
+        with self._lock:
+            snapshot = self._snapshot(scopes)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == snapshot:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        value = compute()
+        with self._lock:
+            self._entries[key] = (snapshot, value)
+        return value
+
+    def stats(self):
+        """Return hit/miss counters and the number of cached entries."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "entries": len(self._entries),
+            }
+
+
+def cached(scopes, copy_result=True):
+    """
+    Decorate a FinanceManager method so its result is served from self.cache.
+
+    :param scopes: Callable taking the method's arguments (self included) and
+                   returning the scopes the result depends on.
+    :param copy_result: Hand callers a deep copy, so mutating a result never
+                        corrupts the cache. Only turn off for results that
+                        callers treat as read-only.
+
+    Calls with unhashable arguments bypass the cache.
+    """
+    def decorator(method):
+        name = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = self.cache
+            if cache is None:
+                return method(self, *args, **kwargs)
+            key = (name, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return method(self, *args, **kwargs)
+            value = cache.get_or_compute(key, scopes(self, *args, **kwargs),
+                                         lambda: method(self, *args, **kwargs))
+            return copy.deepcopy(value) if copy_result else value
+
+        return wrapper
+
+    return decorator
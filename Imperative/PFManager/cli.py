@@ -0,0 +1,287 @@
+"""
+Non-interactive command line for scripted use of FinanceManager.
+
+Each invocation runs one operation and exits:
+
+    python cli.py import ledger.csv more.json      # or '-' to read CSV/JSON from stdin
+    python cli.py add --date 2024-1-5 --category Food --amount 12.5 --type Expense
+    cat rows.csv | python cli.py add --stdin       # bulk add, CSV with a header row
+    python cli.py --json summary
+    python cli.py breakdown
+    python cli.py set-budget Food 400 --period monthly
+    python cli.py budgets                          # spent/remaining in each budget's current period
+    python cli.py trends --freq week --window 4 --start 2024-1-1
+    python cli.py report --output month_end --formats txt,json
+    python cli.py export-changes delta.json --checkpoint sync.json   # only rows added since the last run
+    python cli.py --partitioned compact --before 2024-06
+
+Global options select the data files (--data, --budgets, --savings).
+With --partitioned, transactions live in per-month partitions next to
+--data; 'trends' then reads only the months in its range.
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import sys
+from datetime import timedelta
+
+
+def read_records(stream, fmt):
+    """Parse transactions from an open stream as 'csv' (with header) or 'json' (a list)."""
+    if fmt == "json":
+        data = json.load(stream)
+        if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+            raise ValueError("JSON input must be a list of transaction objects.")
+        return data
+    return list(csv.DictReader(stream))
+
+
+def detect_format(path, default="csv"):
+    if path.lower().endswith(".json"):
+        return "json"
+    if path.lower().endswith(".csv"):
+        return "csv"
+    return default
+
+
+def key_values(payload):
+    """Pair a flat result dict with 'key: value' lines for text output."""
+    return payload, [f"{key}: {value}" for key, value in payload.items()]
+
+
+def emit(args, payload, lines):
+    """Print a result as JSON (--json) or as human-readable lines."""
+    if args.json:
+        json.dump(payload, sys.stdout)
+        sys.stdout.write("\n")
+    else:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def cmd_import(args, manager):
+    before = len(manager.transactions)
+    for path in args.files:
+        if path == "-":
+            manager.import_records(read_records(sys.stdin, args.format or "csv"), "stdin")
+        else:
+            fmt = args.format or detect_format(path)
+            if fmt == "json":
+                manager.import_from_json(path)
+            else:
+                manager.import_from_csv(path)
+    manager.save_transactions()
+    return key_values({"imported": len(manager.transactions) - before, "total": len(manager.transactions)})
+
+
+def cmd_add(args, manager):
+    from transaction import Transaction
+
+    if args.stdin:
+        records = read_records(sys.stdin, args.format or "csv")
+    elif None in (args.date, args.category, args.amount, args.type):
+        raise ValueError("add needs --date, --category, --amount and --type, or --stdin.")
+    else:
+        records = [{"date": args.date, "category": args.category, "amount": args.amount,
+                    "transaction_type": args.type}]
+    transactions = []
+    for r in records:
+        transaction_type = r["transaction_type"]
+        if isinstance(transaction_type, str):
+            transaction_type = transaction_type.capitalize()
+        if transaction_type not in ("Income", "Expense"):
+            raise ValueError(f"Invalid type {r['transaction_type']!r}; use 'Income' or 'Expense'.")
+        transactions.append(Transaction(r["date"], r["category"], r["amount"], transaction_type))
+    manager.add_transactions(transactions)
+    return key_values({"added": len(transactions), "total": len(manager.transactions)})
+
+
+def cmd_summary(args, manager):
+    income, expense, balance = manager.calculate_summary()
+    return {"total_income": income, "total_expense": expense, "balance": balance}, [
+        f"Total Income:   ${income:.2f}",
+        f"Total Expenses: ${expense:.2f}",
+        f"Balance:        ${balance:.2f}",
+    ]
+
+
+def cmd_breakdown(args, manager):
+    breakdown = dict(manager.category_breakdown())
+    return breakdown, [
+        f"{category}: Income = ${values['Income']:.2f}, Expense = ${values['Expense']:.2f}"
+        for category, values in breakdown.items()
+    ]
+
+
+def cmd_budgets(args, manager):
+    status = manager.budget_status()
+    lines = [f"{'Category':<15} {'Period':<8} {'Window':<11} {'Budget':>10} {'Spent':>10} {'Remaining':>10} {'Used':>8}"]
+    for category, b in status.items():
+        lines.append(f"{category:<15} {b['period']:<8} {b['window'] or '-':<11} {b['amount']:>10.2f} "
+                     f"{b['spent']:>10.2f} {b['remaining']:>10.2f} {b['utilization']:>7.1f}%")
+    return status, lines if status else ["No budgets set."]
+
+
+def cmd_set_budget(args, manager):
+    manager.set_budget(args.category, args.amount, args.period)
+    status = manager.budget_status()[args.category]
+    return {args.category: status}, [
+        f"Budget for {args.category}: ${args.amount:.2f} per {args.period}, "
+        f"${status['remaining']:.2f} left this period"
+    ]
+
+
+def cmd_trends(args, manager):
+    return trend_lines(manager.spending_trend_series(args.start, args.end, args.freq, args.window))
+
+
+def store_trends(args, store):
+    """Trends straight from a partitioned store, opening only the months in range."""
+    from Core import trends
+    from Core.dates import to_date
+    from partitions import partition_label
+
+    labels = store.months()
+    if args.start is not None or args.end is not None:
+        # Widen by a week so the partial weeks at both ends are complete
+        slack = timedelta(days=6) if args.freq == "week" else timedelta(0)
+        first = partition_label((to_date(args.start) - slack).isoformat()) if args.start else None
+        last = partition_label((to_date(args.end) + slack).isoformat()) if args.end else None
+        labels = [label for label in labels if (first is None or label >= first) and (last is None or label <= last)]
+    # Month series only need monthly totals, which compacted partitions keep cached
+    ledger = store.summary_ledger(labels) if args.freq == "month" else store.ledger(labels)
+    return trend_lines(trends.spending_series(ledger, args.start, args.end, args.freq, args.window))
+
+
+def trend_lines(series):
+    total = series["total"]
+    lines = [f"{'Period':<12} {'Spent':>12} {'Change':>9} {'Rolling avg':>12}"]
+    for period, value, change, rolling in zip(series["periods"], total["values"],
+                                              total["change_pct"], total["rolling_avg"]):
+        change_text = f"{change:+.1f}%" if change is not None else "-"
+        rolling_text = f"{rolling:.2f}" if rolling is not None else "-"
+        lines.append(f"{period:<12} {value:>12.2f} {change_text:>9} {rolling_text:>12}")
+    return series, lines
+
+
+def cmd_compact(args, manager):
+    compacted = manager.compact_partitions(args.before)
+    return {"compacted": compacted}, [f"Compacted {label}" for label in compacted] or ["Nothing to compact"]
+
+
+def cmd_export_changes(args, manager):
+    from locking import atomic_write_json
+
+    since = args.since
+    if args.checkpoint:
+        try:
+            with open(args.checkpoint, "r") as file:
+                since = int(json.load(file))
+        except FileNotFoundError:
+            since = 0
+    checkpoint = manager.export_changes(args.output, since)
+    if checkpoint is None:
+        raise ValueError("Change export failed.")
+    if args.checkpoint:
+        atomic_write_json(args.checkpoint, checkpoint)
+    return key_values({"since": since, "checkpoint": checkpoint, "output": args.output})
+
+
+def cmd_report(args, manager):
+    formats = [f.strip().lower() for f in args.formats.split(",") if f.strip()]
+    written = manager.export_report_formats(args.output, formats)
+    if not written:
+        raise ValueError("Report export failed.")
+    return {"written": written}, [f"Wrote {path}" for path in written.values()]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cli.py", description="Run one FinanceManager operation and exit.")
+    parser.add_argument("--data", default="transactions.json", help="Transactions file (default: %(default)s)")
+    parser.add_argument("--budgets", default="budgets.json", help="Budgets file (default: %(default)s)")
+    parser.add_argument("--savings", default="savings_goals.json", help="Savings goals file (default: %(default)s)")
+    parser.add_argument("--partitioned", action="store_true",
+                        help="Store transactions as per-month partitions next to --data")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Suppress FinanceManager's progress messages")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("import", help="Import transactions from CSV/JSON files or stdin ('-')")
+    p.add_argument("files", nargs="+")
+    p.add_argument("--format", choices=("csv", "json"), help="Input format (default: from extension, csv for stdin)")
+    p.set_defaults(func=cmd_import)
+
+    p = commands.add_parser("add", help="Add one transaction, or many from stdin")
+    p.add_argument("--date")
+    p.add_argument("--category")
+    p.add_argument("--amount", help="Decimal amount, e.g. 12.50")
+    p.add_argument("--type", help="Income or Expense")
+    p.add_argument("--stdin", action="store_true", help="Read transactions from stdin instead")
+    p.add_argument("--format", choices=("csv", "json"), help="stdin format (default: csv)")
+    p.set_defaults(func=cmd_add)
+
+    p = commands.add_parser("summary", help="Total income, expenses and balance")
+    p.set_defaults(func=cmd_summary)
+
+    p = commands.add_parser("breakdown", help="Income and expenses per category")
+    p.set_defaults(func=cmd_breakdown)
+
+    p = commands.add_parser("budgets", help="Budget status for the current period of each budget")
+    p.set_defaults(func=cmd_budgets)
+
+    p = commands.add_parser("set-budget", help="Set a category budget")
+    p.add_argument("category")
+    p.add_argument("amount", type=float)
+    p.add_argument("--period", choices=("monthly", "weekly"), default="monthly")
+    p.set_defaults(func=cmd_set_budget)
+
+    p = commands.add_parser("trends", help="Spending time series with change and rolling average")
+    p.add_argument("--freq", choices=("month", "week"), default="month")
+    p.add_argument("--window", type=int, default=3)
+    p.add_argument("--start", help="First date (YYYY-MM-DD)")
+    p.add_argument("--end", help="Last date (YYYY-MM-DD)")
+    p.set_defaults(func=cmd_trends, store_func=store_trends)
+
+    p = commands.add_parser("report", help="Export the financial report")
+    p.add_argument("--output", default="financial_report", help="Path without extension (default: %(default)s)")
+    p.add_argument("--formats", default="txt", help="Comma-separated: txt,json,csv,md (default: %(default)s)")
+    p.set_defaults(func=cmd_report)
+
+    p = commands.add_parser("export-changes", help="Export transactions added since a checkpoint")
+    p.add_argument("output", help="File to write; '.csv' for CSV, otherwise JSON")
+    p.add_argument("--since", type=int, default=0, help="Last sequence number already exported (default: 0)")
+    p.add_argument("--checkpoint", help="File holding the checkpoint; read before and updated after the export")
+    p.set_defaults(func=cmd_export_changes)
+
+    p = commands.add_parser("compact", help="Compact finished month partitions (with --partitioned)")
+    p.add_argument("--before", help="Compact months before this one (YYYY-MM, default: current month)")
+    p.set_defaults(func=cmd_compact)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    # Imported here so '--help' and argument errors return without loading the ledger code
+    from Finance_manager import FinanceManager
+    from partitions import PartitionStore, partition_directory
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()) if args.quiet or args.json else contextlib.nullcontext():
+            store = PartitionStore(partition_directory(args.data)) if args.partitioned else None
+            if store is not None and store.exists() and getattr(args, "store_func", None):
+                # Read-only queries that can run on the partitions without loading the whole ledger
+                payload, lines = args.store_func(args, store)
+            else:
+                manager = FinanceManager(args.data, args.budgets, args.savings, partitioned=args.partitioned)
+                payload, lines = args.func(args, manager)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    emit(args, payload, lines)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""
+Host many account ledgers in one process.
+
+Each account is a directory under the host root holding its own
+transactions.json, budgets.json and savings_goals.json:
+
+    python host.py --root accounts month-end --workers 4
+    python host.py --root accounts list
+"""
+import argparse
+import contextlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from Finance_manager import FinanceManager
+
+ACCOUNT_FILES = ("transactions.json", "budgets.json", "savings_goals.json")
+
+
+def _account_report(account_dir, filename, manager_options):
+    """
+    Process pool worker: load one account from disk and export its report.
+
+    Runs in a child process, so it only sees the account's files; its
+    FinanceManager messages are discarded.
+
+    :return: Seconds taken by export_financial_report, or None if it failed.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = FinanceManager(*(os.path.join(account_dir, name) for name in ACCOUNT_FILES), **manager_options)
+        return manager.export_financial_report(filename)
+
+
+class AccountHost:
+    def __init__(self, root, capacity=32, **manager_options):
+        """
+        Keep a bounded number of account FinanceManagers loaded, least recently used first out.
+
+        Each account is isolated in its own directory and FinanceManager.
+        When more than `capacity` accounts are loaded, the least recently
+        used idle one is saved (if it has unsaved transactions) and dropped;
+        it is reloaded from disk on its next use.
+
+        :param root: Directory holding one sub-directory per account.
+        :param capacity: Most accounts kept loaded at once.
+        :param manager_options: Passed to every FinanceManager (e.g. thread_safe=True).
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.root = root
+        self.capacity = capacity
+        self.manager_options = manager_options
+        self._loaded = OrderedDict()  # account_id -> FinanceManager, least recently used first
+        self._pins = {}               # account_id -> number of open account() blocks
+        self._pending = {}            # account_id -> Event set once its load or eviction save is done
+        self._lock = threading.Lock()  # guards the dicts above; never held while loading or saving
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def account_dir(self, account_id):
+        """Return the directory of an account, rejecting ids that would escape the root."""
+        if not account_id or account_id in (".", "..") or "/" in account_id or os.sep in account_id:
+            raise ValueError(f"Invalid account id: {account_id!r}")
+        return os.path.join(self.root, account_id)
+
+    def accounts(self):
+        """Ids of every account on disk, sorted."""
+        try:
+            return sorted(entry.name for entry in os.scandir(self.root) if entry.is_dir())
+        except FileNotFoundError:
+            return []
+
+    def get(self, account_id):
+        """
+        Return the FinanceManager of an account, loading it (and creating its
+        directory) if needed. Prefer account() when other threads share the host,
+        so the manager cannot be evicted while in use.
+
+        Loading happens outside the host lock, so other accounts stay available;
+        callers asking for an account that is being loaded or saved wait for it.
+        """
+        account_dir = self.account_dir(account_id)
+        while True:
+            with self._lock:
+                manager = self._loaded.get(account_id)
+                if manager is not None:
+                    self._loaded.move_to_end(account_id)
+                    self.stats["hits"] += 1
+                    return manager
+                pending = self._pending.get(account_id)
+                if pending is None:
+                    pending = self._pending[account_id] = threading.Event()
+                    self.stats["misses"] += 1
+                    break
+            pending.wait()  # loaded or saved by another thread; look again
+        try:
+            os.makedirs(account_dir, exist_ok=True)
+            manager = FinanceManager(*(os.path.join(account_dir, name) for name in ACCOUNT_FILES),
+                                     **self.manager_options)
+        except BaseException:
+            with self._lock:
+                del self._pending[account_id]
+            pending.set()
+            raise
+        with self._lock:
+            self._loaded[account_id] = manager
+            del self._pending[account_id]
+            evicted = self._evict_over_capacity()
+        pending.set()
+        self._save_evicted(evicted)
+        return manager
+
+    @contextlib.contextmanager
+    def account(self, account_id):
+        """Context manager yielding an account's FinanceManager, pinned against eviction."""
+        with self._lock:
+            self._pins[account_id] = self._pins.get(account_id, 0) + 1
+        try:
+            yield self.get(account_id)
+        finally:
+            with self._lock:
+                self._pins[account_id] -= 1
+                if not self._pins[account_id]:
+                    del self._pins[account_id]
+                evicted = self._evict_over_capacity()
+            self._save_evicted(evicted)
+
+    def _evict_over_capacity(self, everything=False):
+        """
+        Unload idle accounts, least recently used first, until within capacity
+        (or all of them), and mark them pending until saved (lock held).
+
+        :return: [(account_id, manager, event)] for _save_evicted() to save once the lock is released.
+        """
+        evicted = []
+        for account_id in list(self._loaded):
+            if not everything and len(self._loaded) <= self.capacity:
+                break
+            if account_id in self._pins and not everything:
+                continue  # in use; may leave the host over capacity until released
+            pending = self._pending[account_id] = threading.Event()
+            evicted.append((account_id, self._loaded.pop(account_id), pending))
+            if not everything:
+                self.stats["evictions"] += 1
+        return evicted
+
+    def _save_evicted(self, evicted):
+        """Save evicted accounts outside the lock; get() waits for each before reloading it from disk."""
+        for account_id, manager, pending in evicted:
+            try:
+                self._save(manager)
+            finally:
+                with self._lock:
+                    del self._pending[account_id]
+                pending.set()
+
+    @staticmethod
+    def _save(manager):
+        if manager.has_unsaved_changes():
+            manager.save_transactions()
+
+    def flush(self):
+        """Save unsaved transactions of every loaded account (outside the lock)."""
+        with self._lock:
+            managers = list(self._loaded.values())
+        for manager in managers:
+            self._save(manager)
+
+    def close(self):
+        """Flush and unload every account."""
+        with self._lock:
+            evicted = self._evict_over_capacity(everything=True)
+        self._save_evicted(evicted)
+
+    def __len__(self):
+        return len(self._loaded)
+
+    def __contains__(self, account_id):
+        return account_id in self._loaded
+
+    def month_end_reports(self, period=None, accounts=None, workers=None):
+        """
+        Export every account's financial report in parallel on a process pool.
+
+        Loaded accounts are flushed first, so each worker reads the same state
+        from disk; the host's own managers are not touched by the workers.
+
+        :param period: Label in the file name, 'YYYY-MM' (default: the current month).
+        :param accounts: Account ids to report on (default: every account on disk).
+        :param workers: Number of processes (default: one per CPU).
+        :return: (written, failed): {account_id: report path} and {account_id: error message}.
+        """
+        period = period or date.today().strftime("%Y-%m")
+        accounts = self.accounts() if accounts is None else list(accounts)
+        self.flush()
+        written, failed = {}, {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            for account_id in accounts:
+                account_dir = self.account_dir(account_id)
+                filename = os.path.join(account_dir, f"financial_report_{period}.txt")
+                futures[account_id] = (filename, pool.submit(_account_report, account_dir, filename,
+                                                             self.manager_options))
+            for account_id, (filename, future) in futures.items():
+                try:
+                    if future.result() is None:
+                        failed[account_id] = "report export failed"
+                    else:
+                        written[account_id] = filename
+                except Exception as e:
+                    failed[account_id] = f"{type(e).__name__}: {e}"
+        return written, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage many account ledgers in one process.")
+    parser.add_argument("--root", default="accounts", help="Directory with one folder per account")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List the accounts on disk")
+    p = commands.add_parser("month-end", help="Export every account's report in parallel")
+    p.add_argument("--period", help="YYYY-MM used in the report file names (default: current month)")
+    p.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    host = AccountHost(args.root)
+    if args.command == "list":
+        for account_id in host.accounts():
+            print(account_id)
+        return 0
+    written, failed = host.month_end_reports(args.period, workers=args.workers)
+    for account_id, path in written.items():
+        print(f"{account_id}: {path}")
+    for account_id, error in failed.items():
+        print(f"{account_id}: error: {error}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
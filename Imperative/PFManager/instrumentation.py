@@ -0,0 +1,140 @@
+import copy
+import functools
+import os
+import threading
+import time
+
+
+class OperationStats:
+    def __init__(self, kind):
+        """
+        Accumulated measurements for one FinanceManager operation.
+
+        :param kind: Broad group of the operation ('load', 'save', 'import', 'aggregate', 'report').
+        """
+        self.kind = kind
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.rows = 0
+        self.bytes_written = 0
+
+    def to_dict(self):
+        """Convert the stats into a dictionary."""
+        return {
+            "kind": self.kind,
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "avg_time": self.total_time / self.calls if self.calls else 0.0,
+            "max_time": self.max_time,
+            "rows": self.rows,
+            "bytes_written": self.bytes_written,
+        }
+
+
+class Instrumentation:
+    def __init__(self):
+        """Collects call counts, wall time, rows processed and bytes written per operation."""
+        self.stats = {}
+        self._lock = threading.Lock()  # readers may record concurrently in thread-safe mode
+
+    def record(self, operation, kind, elapsed, rows=0, bytes_written=0):
+        """Record one call of an operation."""
+        with self._lock:
+            stats = self.stats.get(operation)
+            if stats is None:
+                stats = self.stats[operation] = OperationStats(kind)
+            stats.calls += 1
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+            stats.rows += rows
+            stats.bytes_written += bytes_written
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            self.stats = {}
+
+    def to_dict(self):
+        """Return {operation: stats dict} for every recorded operation."""
+        with self._lock:
+            return {operation: stats.to_dict() for operation, stats in self.stats.items()}
+
+    def summary(self):
+        """Format the recorded stats as a table, slowest operations first."""
+        with self._lock:  # snapshot, so concurrent record() calls cannot change it mid-iteration
+            stats = [(operation, copy.copy(s)) for operation, s in self.stats.items()]
+        if not stats:
+            return "No operations recorded."
+        lines = [
+            f"{'Operation':<28} {'Kind':<10} {'Calls':>6} {'Total ms':>10} {'Avg ms':>9} {'Rows':>10} {'Bytes':>10}",
+            "-" * 89,
+        ]
+        for operation, s in sorted(stats, key=lambda item: item[1].total_time, reverse=True):
+            lines.append(
+                f"{operation:<28} {s.kind:<10} {s.calls:>6} {s.total_time * 1000:>10.2f} "
+                f"{s.total_time * 1000 / s.calls:>9.2f} {s.rows:>10} {s.bytes_written:>10}"
+            )
+        return "\n".join(lines)
+
+
+def files_size(paths):
+    """Total size in bytes of the given files; missing ones count as 0."""
+    total = 0
+    for path in paths:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total
+
+
+def instrumented(kind, path=None, rows="all", written=None):
+    """
+    Decorate a FinanceManager method so its calls are measured.
+
+    Measurement only happens while ``self.instrumentation`` is set, so the
+    overhead when instrumentation is off is a single attribute check.
+
+    :param kind: Operation group ('load', 'save', 'import', 'aggregate', 'report').
+    :param path: Optional callable taking the method's arguments (self included)
+                 and returning the file it writes; its size is counted as bytes written.
+    :param written: Optional callable taking the method's return value and returning
+                    the bytes the call wrote, for methods that write several files
+                    or append to them.
+    :param rows: 'all' to count every transaction in the ledger, 'added' to count
+                 only transactions added by the call, or None to count none.
+    """
+    def decorator(method):
+        operation = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            instrumentation = self.instrumentation
+            if instrumentation is None:
+                return method(self, *args, **kwargs)
+
+            before = len(self.transactions)
+            start = time.perf_counter()
+            result = None
+            try:
+                result = method(self, *args, **kwargs)
+                return result
+            finally:
+                elapsed = time.perf_counter() - start
+                if rows == "all":
+                    row_count = len(self.transactions)
+                elif rows == "added":
+                    row_count = len(self.transactions) - before
+                else:
+                    row_count = 0
+                bytes_written = 0
+                if path is not None:
+                    bytes_written = files_size([path(self, *args, **kwargs)])
+                elif written is not None and result is not None:
+                    bytes_written = written(result)
+                instrumentation.record(operation, kind, elapsed, row_count, bytes_written)
+
+        return wrapper
+
+    return decorator
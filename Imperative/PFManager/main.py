@@ -1,10 +1,26 @@
+import os
 from Finance_manager import FinanceManager
 from transaction import Transaction
+from Core.dates import to_date  # importable once Finance_manager has put the repository root on sys.path
+
+
+def read_date(prompt):
+    """Ask for a date until it is a real one, as the type prompt does for the type."""
+    while True:
+        date = input(prompt)
+        try:
+            to_date(date)
+            return date
+        except ValueError:
+            print("Invalid date. Please enter a date such as 2024-12-13.")
 
 
 def main():
     print("=== Finance Manager ===")
-    manager = FinanceManager()
+    # Set PFM_INSTRUMENT=1 to record operation timings from startup,
+    # PFM_PARTITIONED=1 to keep transactions in per-month partitions
+    manager = FinanceManager(instrument=bool(os.environ.get("PFM_INSTRUMENT")),
+                             partitioned=bool(os.environ.get("PFM_PARTITIONED")))
 
     while True:
         print("\nOptions:")
@@ -22,13 +38,15 @@ def main():
         print("12. Import transactions from CSV")
         print("13. Import transactions from Json")
         print("14. Export Financial data as Report")
+        print("15. Performance Stats")
+        print("16. Export Report as TXT/JSON/CSV/Markdown")
         print("0. Exit")
 
-        choice = input("Enter your choice (1-12): ")
+        choice = input("Enter your choice (0-16): ")
 
         if choice == "1":
             # Add transaction
-            date = input("Enter date (YYYY-MM-DD): ")
+            date = read_date("Enter date (YYYY-MM-DD): ")
             category = input("Enter category (e.g., Food, Rent): ")
             amount = float(input("Enter amount: "))
             transaction_type = input("Is this 'Income' or 'Expense'? ").capitalize()
@@ -38,7 +56,10 @@ def main():
                 transaction_type = input("Is this 'Income' or 'Expense'? ").capitalize()
 
             transaction = Transaction(date, category, amount, transaction_type)
-            manager.add_transaction(transaction)
+            try:
+                manager.add_transaction(transaction)
+            except ValueError as e:
+                print(f"Transaction not added: {e}")
 
         elif choice == "2":
             # View current balance
@@ -120,24 +141,51 @@ def main():
 
         elif choice == "12":
             filename = input("Enter the CSV file path: ")
-            manager.import_from_csv(filename)       
+            try:
+                manager.import_from_csv(filename)
+            except (OSError, ValueError) as e:
+                print(f"Nothing imported: {e}")
 
         elif choice == "13":
             filename = input("Enter the JSON file path: ")
-            manager.import_from_json(filename)    
+            try:
+                manager.import_from_json(filename)
+            except (OSError, ValueError) as e:
+                print(f"Nothing imported: {e}")
 
         elif choice == "14":
             # Export Financial Report
             filename = input("Enter filename for the report (default: financial_report.txt): ") or "financial_report.txt"
             manager.export_financial_report(filename) 
 
+        elif choice == "15":
+            # Show operation timings, enabling instrumentation on first use
+            if manager.instrumentation is None:
+                manager.enable_instrumentation()
+                print("Instrumentation enabled. Operations will be timed from now on.")
+            else:
+                print("\n=== Performance Stats ===")
+                print(manager.performance_summary())
+                cache = manager.performance_stats()["date_parse_cache"]
+                print(f"Date parse cache: {cache['hits']} hits, {cache['misses']} misses")
+                results = manager.cache_stats()
+                if results:
+                    print(f"Result cache: {results['hits']} hits, {results['misses']} misses, "
+                          f"{results['entries']} entries")
+
+        elif choice == "16":
+            # Export one report in several formats
+            base_path = input("Enter the report path without extension (default: financial_report): ") or "financial_report"
+            formats = input("Formats, comma-separated (txt,json,csv,md) [all]: ") or "txt,json,csv,md"
+            manager.export_report_formats(base_path, [f.strip().lower() for f in formats.split(",") if f.strip()])
+
         elif choice == "0":
             # Exit the program
             print("Exiting Finance Manager. Goodbye!")
             break
 
         else:
-            print("Invalid choice. Please enter a number between 1 and 12.")
+            print("Invalid choice. Please enter a number between 0 and 16.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,254 @@
+import json
+import os
+from datetime import date
+
+from locking import atomic_write_json
+
+from Core.dates import to_date
+from Core.ledger import Ledger
+from Core.money import parse_cents
+
+MANIFEST = "manifest.json"
+MANIFEST_VERSION = 2  # 2: cached summaries are integer cents
+UNDATED = "undated"  # partition of saved rows whose date cannot be parsed; kept so no row is lost
+
+
+def partition_label(date_string):
+    """Return the 'YYYY-MM' partition a transaction date belongs to (ValueError if it is not a real date)."""
+    day = to_date(date_string)
+    return f"{day.year:04d}-{day.month:02d}"
+
+
+def record_partition(record):
+    """Return the partition a saved record belongs to: its month, or UNDATED if its date cannot place it."""
+    try:
+        return partition_label(record["date"])
+    except (KeyError, TypeError, AttributeError, ValueError):
+        return UNDATED
+
+
+def _add_records(ledger, records):
+    """Append saved records to a ledger, leaving out rows that cannot be parsed (kept in the files as they are)."""
+    for r in records:
+        try:
+            to_date(r["date"])  # parse_date alone lets a month such as 13 through
+            ledger.append(r["date"], r["category"], parse_cents(r["amount"]), r["transaction_type"])
+        except (KeyError, TypeError, AttributeError, ValueError):
+            continue
+    return ledger
+
+
+def partition_directory(data_file):
+    """Directory holding the partitioned form of a transactions file ('transactions.json' -> 'transactions')."""
+    return os.path.splitext(data_file)[0]
+
+
+class PartitionStore:
+    def __init__(self, directory):
+        """
+        Transactions stored as one partition per month, plus a manifest.
+
+        Each month is an append-only JSON Lines log ('YYYY-MM.jsonl'), so
+        adding transactions only appends to the partitions they fall in.
+        Compacting a month rewrites it as a plain JSON array ('YYYY-MM.json')
+        and caches its per-category income/expense totals in the manifest,
+        so month-level aggregates never need to open it again. Transactions
+        added to a compacted month later go to a fresh log next to it, and
+        the cached totals are dropped until the next compaction.
+
+        manifest.json: {"version": 2, "partitions": {"YYYY-MM": {"rows": n,
+        "compacted": bool, "log_offset": bytes, "summary": {category: [income, expense]}}}}
+        with summary totals in integer cents.
+
+        "log_offset" is how much of the log is already folded into the
+        compacted file; it keeps a compaction interrupted before the log is
+        removed from counting those rows twice.
+
+        :param directory: Directory of the store; created on first write.
+        """
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST)
+        self.partitions = self._load_manifest()
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, "r") as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            return {}
+        partitions = manifest["partitions"]
+        if manifest.get("version", 1) < MANIFEST_VERSION:
+            for entry in partitions.values():
+                entry.pop("summary", None)  # older summaries were in currency units; rebuilt on compaction
+        return partitions
+
+    def _save_manifest(self):
+        atomic_write_json(self.manifest_path, {"version": MANIFEST_VERSION, "partitions": self.partitions})
+
+    def exists(self):
+        """True once the store has been written (its manifest exists)."""
+        return os.path.exists(self.manifest_path)
+
+    def months(self):
+        """Labels of every partition, oldest first."""
+        return sorted(self.partitions)
+
+    def _compacted_path(self, label):
+        return os.path.join(self.directory, f"{label}.json")
+
+    def _log_path(self, label):
+        return os.path.join(self.directory, f"{label}.jsonl")
+
+    # --- reading -------------------------------------------------------------
+
+    def read(self, label):
+        """Return the records of one partition: its compacted rows, then its log."""
+        records = []
+        entry = self.partitions.get(label)
+        if entry is None:
+            return records
+        if entry.get("compacted"):
+            with open(self._compacted_path(label), "r") as file:
+                records.extend(json.load(file))
+        try:
+            with open(self._log_path(label), "rb") as file:
+                file.seek(entry.get("log_offset", 0))
+                lines = file.read().split(b"\n")
+        except FileNotFoundError:
+            return records
+        for line in lines:
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # torn line from an interrupted append
+        return records
+
+    def load(self, months=None):
+        """
+        Yield the records of the given partitions (default: all), oldest month first.
+
+        :param months: Iterable of 'YYYY-MM' labels; unknown months are skipped.
+        """
+        labels = self.months() if months is None else sorted(set(months) & self.partitions.keys())
+        for label in labels:
+            yield from self.read(label)
+
+    def ledger(self, months=None):
+        """Build a Core Ledger from only the given partitions."""
+        return _add_records(Ledger(), self.load(months))
+
+    def summary_ledger(self, months=None):
+        """
+        Build a Ledger for month-level aggregates, opening as few files as possible.
+
+        Compacted months with cached totals contribute one row per category
+        and kind, dated the first of the month; other months are read in full.
+        Only use it for aggregates that do not look below month granularity.
+        """
+        ledger = Ledger()
+        labels = self.months() if months is None else sorted(set(months) & self.partitions.keys())
+        for label in labels:
+            summary = self.partitions[label].get("summary")
+            if summary is None:
+                _add_records(ledger, self.read(label))
+                continue
+            first_day = f"{label}-01"
+            for category, (income, expense) in summary.items():
+                if income:
+                    ledger.append(first_day, category, income, "Income")
+                if expense:
+                    ledger.append(first_day, category, expense, "Expense")
+        return ledger
+
+    # --- writing -------------------------------------------------------------
+
+    def append(self, records):
+        """
+        Append records to their month partitions and update the manifest.
+
+        Only the logs of the months the records fall in are opened, each once.
+
+        :return: Number of bytes appended to the logs.
+        """
+        by_month = {}
+        for r in records:
+            by_month.setdefault(record_partition(r), []).append(r)
+        if not by_month:
+            return 0
+        os.makedirs(self.directory, exist_ok=True)
+        appended = 0
+        for label, rows in by_month.items():
+            entry = self.partitions.setdefault(label, {"rows": 0, "compacted": False})
+            log_path = self._log_path(label)
+            prefix = ""
+            has_log = os.path.exists(log_path)
+            size = os.path.getsize(log_path) if has_log else 0
+            if not has_log:
+                entry["log_offset"] = 0
+            elif size:
+                with open(log_path, "rb") as file:
+                    file.seek(-1, os.SEEK_END)
+                    if file.read(1) != b"\n":
+                        prefix = "\n"  # end a torn line so it cannot swallow the first new row
+            with open(log_path, "a") as file:
+                file.write(prefix + "".join(json.dumps(r) + "\n" for r in rows))
+            appended += os.path.getsize(log_path) - size
+            entry["rows"] += len(rows)
+            entry.pop("summary", None)  # cached totals no longer cover the log
+        self._save_manifest()
+        return appended
+
+    def compact(self, before=None):
+        """
+        Compact every partition older than a month that still has a log.
+
+        Each one is rewritten as a single JSON array, its log is removed and
+        its per-category totals are cached in the manifest.
+
+        :param before: 'YYYY-MM' label; default: the current month, so only
+                       finished months are compacted.
+        :return: Labels of the partitions compacted.
+        """
+        if before is None:
+            before = date.today().strftime("%Y-%m")
+        compacted = []
+        for label in self.months():
+            if label >= before or not os.path.exists(self._log_path(label)):
+                continue
+            self._write_compacted(label, self.read(label))
+            compacted.append(label)
+        return compacted
+
+    def rewrite(self, records):
+        """
+        Replace the contents of the partitions the records fall in with the
+        records, compacted (e.g. to persist sequence numbers given to old rows).
+
+        :param records: Every record of each partition to rewrite.
+        :return: Labels of the partitions rewritten.
+        """
+        by_month = {}
+        for r in records:
+            by_month.setdefault(record_partition(r), []).append(r)
+        os.makedirs(self.directory, exist_ok=True)
+        for label, rows in sorted(by_month.items()):
+            self._write_compacted(label, rows)
+        return sorted(by_month)
+
+    def _write_compacted(self, label, records):
+        """Write a partition as a single JSON array, cache its totals and remove its log."""
+        log_path = self._log_path(label)
+        has_log = os.path.exists(log_path)
+        log_size = os.path.getsize(log_path) if has_log else 0
+        atomic_write_json(self._compacted_path(label), records, indent=None)
+        ledger = _add_records(Ledger(), records)
+        entry = self.partitions[label] = {"rows": len(records), "compacted": True,
+                                          "log_offset": log_size,
+                                          "summary": ledger.category_breakdown()}
+        self._save_manifest()  # the whole log is now folded in; only then remove it
+        if has_log:
+            os.remove(log_path)
+        entry["log_offset"] = 0
+        self._save_manifest()
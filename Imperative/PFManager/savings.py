@@ -0,0 +1,149 @@
+from Core.dates import parse_date
+from Core.money import parse_cents, to_units
+
+RULES = ("proportional", "priority", "fixed")
+
+
+def _cents(goal, key):
+    """An amount of a goal dict (stored in currency units, for JSON) as integer cents."""
+    return parse_cents(goal.get(key) or 0)
+
+
+def month_label(date_string):
+    """Return the 'YYYY-MM' contribution bucket of a transaction date."""
+    year, month, _ = parse_date(date_string)
+    return f"{year}-{month:02d}"
+
+
+class SavingsAllocator:
+    def __init__(self, goals, rule="proportional", savings_rate=1.0):
+        """
+        Distribute income across savings goals.
+
+        Goals are the FinanceManager's savings goal dicts and are updated in
+        place: "saved_amount" is kept current and "contributions" holds a
+        compact {'YYYY-MM': amount} history per goal, so progress and
+        recommendations never need to rescan transactions.
+
+        All allocation is done in integer cents; the goal dicts keep
+        currency units (exact to the cent) since they are saved as JSON.
+
+        :param goals: {goal_name: {"target_amount", "months_to_save", "saved_amount", ...}}
+        :param rule: 'proportional' splits income by each goal's monthly need,
+                     'priority' fills goals in priority order,
+                     'fixed' gives each goal its fixed monthly amount, in priority order.
+        :param savings_rate: Fraction of income that is set aside for goals.
+        """
+        if rule not in RULES:
+            raise ValueError(f"Unknown savings rule '{rule}'. Use one of: {', '.join(RULES)}.")
+        if not 0 <= savings_rate <= 1:
+            raise ValueError("savings_rate must be between 0 and 1.")
+        self.goals = goals
+        self.rule = rule
+        self.savings_rate = savings_rate
+
+    @staticmethod
+    def remaining(goal):
+        """Cents still missing from the goal's target."""
+        return max(_cents(goal, "target_amount") - _cents(goal, "saved_amount"), 0)
+
+    @staticmethod
+    def monthly_need(goal):
+        """Monthly cents the goal asks for: its fixed amount, or target spread over its months (rounded up)."""
+        if goal.get("monthly_amount"):
+            return _cents(goal, "monthly_amount")
+        return -(-_cents(goal, "target_amount") // max(goal["months_to_save"], 1))
+
+    def _open_goals(self):
+        """Unfinished goals, in priority order (lower first; unset last, then insertion order)."""
+        open_goals = [(name, goal) for name, goal in self.goals.items() if self.remaining(goal) > 0]
+        open_goals.sort(key=lambda item: item[1].get("priority") if item[1].get("priority") is not None
+                        else float("inf"))
+        return open_goals
+
+    def _split(self, month, amount):
+        """Return {goal_name: share in cents} for one month's allocatable cents under the current rule."""
+        shares = {}
+        open_goals = self._open_goals()
+        if self.rule == "priority":
+            for name, goal in open_goals:
+                if amount <= 0:
+                    break
+                share = min(amount, self.remaining(goal))
+                shares[name] = share
+                amount -= share
+        elif self.rule == "fixed":
+            for name, goal in open_goals:
+                if amount <= 0:
+                    break
+                already = parse_cents(goal.get("contributions", {}).get(month, 0))  # earlier income this month
+                share = min(amount, max(self.monthly_need(goal) - already, 0), self.remaining(goal))
+                shares[name] = share
+                amount -= share
+        else:
+            # Proportional to monthly need; capped goals hand their excess back to the rest
+            while amount > 0 and open_goals:
+                needs = [max(self.monthly_need(goal), 1) for _, goal in open_goals]
+                total_need = sum(needs)
+                # Whole-cent shares; the cents left over go one each to the largest
+                # remainders (earlier goals first on ties), so the split is exact
+                split = [divmod(amount * need, total_need) for need in needs]
+                cents = [share for share, _ in split]
+                leftover = amount - sum(cents)
+                for i in sorted(range(len(split)), key=lambda i: -split[i][1])[:leftover]:
+                    cents[i] += 1
+                capped = []
+                spent = 0
+                for (name, goal), share in zip(open_goals, cents):
+                    room = self.remaining(goal) - shares.get(name, 0)
+                    if share >= room:
+                        share = room
+                        capped.append(name)
+                    shares[name] = shares.get(name, 0) + share
+                    spent += share
+                amount -= spent
+                if not capped:
+                    break
+                open_goals = [(name, goal) for name, goal in open_goals if name not in capped]
+        return {name: share for name, share in shares.items() if share > 0}
+
+    def allocate(self, income_by_month):
+        """
+        Allocate aggregated income to the goals, month by month in date order.
+
+        :param income_by_month: {'YYYY-MM': total income in that month, in integer cents}
+        :return: {goal_name: total contributed by this call, in currency units}
+        """
+        contributed = {}
+        for month in sorted(income_by_month):
+            for name, share in self._split(month, round(income_by_month[month] * self.savings_rate)).items():
+                goal = self.goals[name]
+                goal["saved_amount"] = to_units(_cents(goal, "saved_amount") + share)
+                history = goal.setdefault("contributions", {})
+                history[month] = to_units(parse_cents(history.get(month, 0)) + share)
+                contributed[name] = contributed.get(name, 0) + share
+        return {name: to_units(cents) for name, cents in contributed.items()}
+
+    def allocate_transactions(self, transactions):
+        """Aggregate the income in a batch of transactions per month (exactly, in cents) and allocate it."""
+        income_by_month = {}
+        for t in transactions:
+            if t.transaction_type == "Income":
+                month = month_label(t.date)
+                income_by_month[month] = income_by_month.get(month, 0) + t.cents
+        return self.allocate(income_by_month) if income_by_month else {}
+
+    def progress(self, goal_name):
+        """Return (saved_amount, remaining_amount) for a goal, in currency units."""
+        goal = self.goals[goal_name]
+        saved = _cents(goal, "saved_amount")
+        return to_units(saved), to_units(_cents(goal, "target_amount") - saved)
+
+    def recommended_monthly(self, goal_name):
+        """
+        Monthly amount still needed to finish on time: what remains, spread
+        over the months of the plan that have not had a contribution yet.
+        """
+        goal = self.goals[goal_name]
+        months_left = max(goal["months_to_save"] - len(goal.get("contributions", ())), 1)
+        return to_units(-(-self.remaining(goal) // months_left))  # rounded up to the cent
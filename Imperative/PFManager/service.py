@@ -0,0 +1,306 @@
+"""
+Local asyncio HTTP/JSON service around FinanceManager.
+
+    python service.py --port 8765
+
+Endpoints:
+    POST /transactions          one transaction object or a list of them
+    GET  /balance               {"balance": x}
+    GET  /summary               {"total_income", "total_expense", "balance"}
+    GET  /breakdown             {category: {"Income": x, "Expense": y}}
+    GET  /budgets               {category: budget status in its current period}
+    GET  /trends?freq=&window=  spending_trend_series()
+    GET  /top-expenses?n=       the n largest expenses
+    GET  /changes?since=        {"checkpoint", "transactions"} added after a checkpoint
+    GET  /stats                 service counters
+
+Writes from all clients are queued and applied in batches (one lock and one
+save per batch); reads and batch writes run in a thread pool so the event
+loop keeps accepting connections while aggregations are computed.
+"""
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from Finance_manager import FinanceManager
+from transaction import Transaction
+
+STATUS_TEXT = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+               405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+MAX_BODY = 16 * 1024 * 1024
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_transaction(data):
+    """Validate one JSON object and build a Transaction from it."""
+    if not isinstance(data, dict):
+        raise HTTPError(400, "Each transaction must be a JSON object.")
+    try:
+        transaction_type = str(data["transaction_type"]).capitalize()
+        if transaction_type not in ("Income", "Expense"):
+            raise HTTPError(400, "transaction_type must be 'Income' or 'Expense'.")
+        transaction = Transaction(data["date"], str(data["category"]), data["amount"], transaction_type)
+        FinanceManager.check_transaction(transaction)  # the ledger's own checks, so a bad row fails alone
+        return transaction
+    except KeyError as e:
+        raise HTTPError(400, f"Missing field: {e.args[0]}")
+    except (AttributeError, TypeError, ValueError) as e:
+        raise HTTPError(400, f"Invalid transaction: {e}")
+
+
+def _settle(future, error):
+    """Complete a queued write's future with its outcome, unless its client has gone."""
+    if not future.done():
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
+
+
+class FinanceService:
+    def __init__(self, manager, batch_size=1000, batch_delay=0.005, workers=4):
+        """
+        Serve a FinanceManager over HTTP on localhost.
+
+        :param manager: The FinanceManager to serve; it should be thread_safe.
+        :param batch_size: Most transactions applied in one batch.
+        :param batch_delay: Seconds to wait for more writes before applying a batch.
+        :param workers: Threads for aggregations and batch writes.
+        """
+        self.manager = manager
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.server = None
+        self._pending = []          # (transactions, future) awaiting the next batch
+        self._wakeup = None
+        self._flusher = None
+        self.stats = {"requests": 0, "batches": 0, "transactions": 0}
+        self.routes = {
+            ("POST", "/transactions"): self.post_transactions,
+            ("GET", "/balance"): self.get_balance,
+            ("GET", "/summary"): self.get_summary,
+            ("GET", "/breakdown"): self.get_breakdown,
+            ("GET", "/budgets"): self.get_budgets,
+            ("GET", "/trends"): self.get_trends,
+            ("GET", "/top-expenses"): self.get_top_expenses,
+            ("GET", "/changes"): self.get_changes,
+            ("GET", "/stats"): self.get_stats,
+        }
+
+    async def start(self, host="127.0.0.1", port=8765):
+        """Start listening; port 0 picks a free port (see self.port)."""
+        self._wakeup = asyncio.Event()
+        self._flusher = asyncio.create_task(self._flush_loop())
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        """Stop accepting connections, apply queued writes and shut down."""
+        self.server.close()
+        await self.server.wait_closed()
+        self._flusher.cancel()
+        try:
+            await self._flusher
+        except asyncio.CancelledError:
+            pass
+        while self._pending:
+            await self._apply_batch()
+        self.executor.shutdown(wait=True)
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    # --- write batching ----------------------------------------------------
+
+    async def _flush_loop(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            # Give concurrent clients a moment to add to this batch
+            if sum(len(t) for t, _ in self._pending) < self.batch_size:
+                await asyncio.sleep(self.batch_delay)
+            while self._pending:
+                await self._apply_batch()
+
+    async def _apply_batch(self):
+        batch, count = [], 0
+        while self._pending and (not batch or count + len(self._pending[0][0]) <= self.batch_size):
+            transactions, future = self._pending.pop(0)
+            batch.append((transactions, future))
+            count += len(transactions)
+        error = await self._apply([t for transactions, _ in batch for t in transactions])
+        if isinstance(error, ValueError) and len(batch) > 1:
+            # add_transactions checks every row before adding any, so the rejected batch changed
+            # nothing: apply each request alone so one client's bad row cannot fail another's write
+            for transactions, future in batch:
+                _settle(future, await self._apply(transactions))
+            return
+        for _, future in batch:
+            _settle(future, error)
+
+    async def _apply(self, transactions):
+        """Add transactions in one locked call; return the exception that rejected them, or None."""
+        try:
+            await self._run(self.manager.add_transactions, transactions)
+        except Exception as e:
+            return e
+        self.stats["batches"] += 1
+        self.stats["transactions"] += len(transactions)
+        return None
+
+    # --- handlers ----------------------------------------------------------
+
+    async def post_transactions(self, query, body):
+        try:
+            data = json.loads(body or b"null")
+        except ValueError:
+            raise HTTPError(400, "Body is not valid JSON.")
+        items = data if isinstance(data, list) else [data]
+        transactions = [parse_transaction(item) for item in items]
+        if not transactions:
+            return 200, {"added": 0}
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((transactions, future))
+        self._wakeup.set()
+        try:
+            await future
+        except ValueError as e:
+            raise HTTPError(400, f"Invalid transaction: {e}")
+        return 201, {"added": len(transactions)}
+
+    async def get_balance(self, query, body):
+        return 200, {"balance": await self._run(self.manager.get_balance)}
+
+    async def get_summary(self, query, body):
+        income, expense, balance = await self._run(self.manager.calculate_summary)
+        return 200, {"total_income": income, "total_expense": expense, "balance": balance}
+
+    async def get_breakdown(self, query, body):
+        return 200, dict(await self._run(self.manager.category_breakdown))
+
+    async def get_budgets(self, query, body):
+        return 200, await self._run(self.manager.budget_status)
+
+    async def get_trends(self, query, body):
+        try:
+            window = int(query.get("window", 3))
+            freq = query.get("freq", "month")
+            return 200, await self._run(
+                self.manager.spending_trend_series, query.get("start"), query.get("end"), freq, window)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+
+    async def get_top_expenses(self, query, body):
+        try:
+            n = int(query.get("n", 10))
+        except ValueError:
+            raise HTTPError(400, "n must be an integer.")
+        top = await self._run(self.manager.top_expenses, n)
+        return 200, [t.to_dict() for t in top]
+
+    async def get_changes(self, query, body):
+        try:
+            since = int(query.get("since", 0))
+        except ValueError:
+            raise HTTPError(400, "since must be an integer.")
+        changes = await self._run(self.manager.changes_since, since)
+        return 200, {"checkpoint": changes[-1].seq if changes else since,
+                     "transactions": [t.to_dict() for t in changes]}
+
+    async def get_stats(self, query, body):
+        return 200, {**self.stats, "pending": sum(len(t) for t, _ in self._pending)}
+
+    # --- HTTP plumbing -----------------------------------------------------
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "Malformed request line."}, False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0) or 0)
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {"error": "Body too large."}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+                self.stats["requests"] += 1
+                url = urlsplit(target)
+                query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                handler = self.routes.get((method.upper(), url.path))
+                try:
+                    if handler is None:
+                        known = any(path == url.path for _, path in self.routes)
+                        raise HTTPError(405 if known else 404, f"No route for {method} {url.path}")
+                    status, payload = await handler(query, body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except Exception as e:
+                    status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode()
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode() + body)
+        await writer.drain()
+
+
+async def serve(manager, host, port, **options):
+    service = await FinanceService(manager, **options).start(host, port)
+    print(f"Finance service listening on http://{host}:{service.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve FinanceManager over a local HTTP/JSON API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--batch-delay", type=float, default=0.005, help="Seconds to wait when batching writes")
+    args = parser.parse_args(argv)
+
+    manager = FinanceManager(thread_safe=True)
+    try:
+        asyncio.run(serve(manager, args.host, args.port,
+                          batch_size=args.batch_size, batch_delay=args.batch_delay))
+    except KeyboardInterrupt:
+        print("\nFinance service stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,39 @@
+from Core.money import parse_cents, to_units
+
+
 class Transaction:
-    def __init__(self, date, category, amount, transaction_type):
+    def __init__(self, date, category, amount, transaction_type, seq=None):
         """
         Initialize a Transaction object.
 
         :param date: Date of the transaction (str, YYYY-MM-DD)
         :param category: Category of the transaction (e.g., Food, Rent)
-        :param amount: Amount of the transaction (float)
+        :param amount: Amount of the transaction (decimal str, int or float); stored as integer cents
         :param transaction_type: Type of transaction - 'Income' or 'Expense' (str)
+        :param seq: Sequence number, assigned by FinanceManager when the transaction is added (int)
         """
         self.date = date
         self.category = category
-        self.amount = amount
+        self.cents = parse_cents(amount)
         self.transaction_type = transaction_type
+        self.seq = seq
+
+    @property
+    def amount(self):
+        """The amount in currency units (float), for display."""
+        return to_units(self.cents)
 
     def to_dict(self):
         """Convert the Transaction object into a dictionary for JSON saving."""
-        return {
+        data = {
             "date": self.date,
             "category": self.category,
-            "amount": self.amount,
+            "amount": to_units(self.cents),
             "transaction_type": self.transaction_type
         }
+        if self.seq is not None:
+            data["seq"] = self.seq
+        return data
 
     @classmethod
     def from_dict(cls, data):
@@ -29,5 +42,6 @@ class Transaction:
             data["date"],
             data["category"],
             data["amount"],
-            data["transaction_type"]
+            data["transaction_type"],
+            data.get("seq")
         )
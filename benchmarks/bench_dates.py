@@ -0,0 +1,51 @@
+"""
+Microbenchmark: Core.dates.parse_date versus datetime.strptime.
+
+Run from the repository root:  python -m benchmarks.bench_dates
+"""
+import random
+import timeit
+from datetime import datetime
+
+from Core.dates import parse_date, to_date
+
+
+def make_dates(count, distinct=730, seed=1):
+    rng = random.Random(seed)
+    pool = []
+    for i in range(distinct):
+        year, month, day = 2000 + i // 365, rng.randint(1, 12), rng.randint(1, 28)
+        pool.append(rng.choice((f"{year}-{month}-{day}", f"{year}-{month}", f"{day:02d}/{month:02d}/{year}")))
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def main(count=100_000, repeat=3):
+    dates = make_dates(count)
+    iso_dates = [f"{y}-{m:02d}-{d:02d}" for y, m, d in map(parse_date, dates)]
+
+    def strptime_all():
+        for s in iso_dates:
+            datetime.strptime(s, "%Y-%m-%d").date()
+
+    def parse_cold():
+        parse_date.cache_clear()
+        for s in dates:
+            parse_date(s)
+
+    def parse_warm():
+        for s in dates:
+            parse_date(s)
+
+    def to_date_warm():
+        for s in dates:
+            to_date(s)
+
+    print(f"{count} dates, best of {repeat}:")
+    for name, func in (("strptime", strptime_all), ("parse_date (cold)", parse_cold),
+                       ("parse_date (warm)", parse_warm), ("to_date (warm)", to_date_warm)):
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"  {name:<20} {best * 1000:8.1f} ms  ({best / count * 1e9:6.0f} ns/date)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compare serial and process-pool month-end reports across many accounts.
+
+Creates `accounts` account directories under a temporary AccountHost root,
+then exports every report one after another and again through
+AccountHost.month_end_reports.
+
+Run from the repository root:  python -m benchmarks.bench_month_end --accounts 16 --rows 50000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "Imperative", "PFManager"))
+
+from host import AccountHost, _account_report  # noqa: E402
+
+from benchmarks.ledger_gen import generate_budgets, generate_ledger, generate_savings_goals, write_json  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=16)
+    parser.add_argument("--rows", type=int, default=50_000, help="Transactions per account")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as root:
+        host = AccountHost(root)
+        for i in range(args.accounts):
+            account_dir = os.path.join(root, f"account-{i:03d}")
+            os.makedirs(account_dir)
+            write_json(os.path.join(account_dir, "transactions.json"), generate_ledger(args.rows, seed=i))
+            write_json(os.path.join(account_dir, "budgets.json"), generate_budgets(seed=i))
+            write_json(os.path.join(account_dir, "savings_goals.json"), generate_savings_goals(seed=i))
+
+        start = time.perf_counter()
+        for account_id in host.accounts():
+            account_dir = host.account_dir(account_id)
+            _account_report(account_dir, os.path.join(account_dir, "serial.txt"), {})
+        serial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        written, failed = host.month_end_reports("bench", workers=args.workers)
+        parallel = time.perf_counter() - start
+
+    print(f"{args.accounts} accounts x {args.rows} rows: serial {serial:.2f} s, "
+          f"process pool {parallel:.2f} s ({serial / parallel:.1f}x)")
+    print("OK" if len(written) == args.accounts and not failed else f"FAILED: {failed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Time FinanceManager.export_financial_report on a large synthetic ledger.
+
+Run from the repository root:  python -m benchmarks.bench_report --rows 1000000
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "Imperative", "PFManager"))
+
+from Finance_manager import FinanceManager  # noqa: E402
+from transaction import Transaction  # noqa: E402
+
+from benchmarks.ledger_gen import (  # noqa: E402
+    generate_budgets, generate_ledger, generate_savings_goals, write_json,
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Ledger size (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs, best is kept")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        write_json(os.path.join(workdir, "budgets.json"), generate_budgets())
+        write_json(os.path.join(workdir, "savings.json"), generate_savings_goals())
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager = FinanceManager(os.path.join(workdir, "transactions.json"),
+                                     os.path.join(workdir, "budgets.json"),
+                                     os.path.join(workdir, "savings.json"),
+                                     cache=False)  # time a full rebuild on every run
+        for t in generate_ledger(args.rows):
+            manager._ingest(Transaction.from_dict(t))
+
+        report = os.path.join(workdir, "report.txt")
+        times = []
+        for _ in range(args.repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                times.append(manager.export_financial_report(report))
+        print(f"export_financial_report, {args.rows} rows: best {min(times) * 1000:.1f} ms "
+              f"({args.rows / min(times):,.0f} rows/s) over {args.repeat} runs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Load-test the asyncio FinanceManager service on localhost.
+
+Starts the service in-process on a free port, then many concurrent clients
+post transactions over keep-alive connections while others query balances.
+
+Run from the repository root:  python -m benchmarks.bench_service --clients 50 --posts 100
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "Imperative", "PFManager"))
+
+from Finance_manager import FinanceManager  # noqa: E402
+from service import FinanceService  # noqa: E402
+
+from benchmarks.ledger_gen import generate_ledger  # noqa: E402
+
+
+async def request(reader, writer, method, path, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+                 + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":")[1])
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def client(port, transactions, latencies, queries):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for i, t in enumerate(transactions):
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, "POST", "/transactions", t)
+            latencies.append(time.perf_counter() - start)
+            assert status == 201, status
+            if queries and i % queries == 0:
+                status, _ = await request(reader, writer, "GET", "/balance")
+                assert status == 200, status
+    finally:
+        writer.close()
+
+
+async def run(args, workdir):
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = FinanceManager(os.path.join(workdir, "transactions.json"),
+                                 os.path.join(workdir, "budgets.json"),
+                                 os.path.join(workdir, "savings.json"), thread_safe=True)
+    service = await FinanceService(manager, batch_delay=args.batch_delay).start("127.0.0.1", 0)
+    ledger = generate_ledger(args.clients * args.posts, seed=3)
+    latencies = []
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        await asyncio.gather(*(
+            client(service.port, ledger[i::args.clients], latencies, args.query_every)
+            for i in range(args.clients)
+        ))
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", service.port)
+    _, stats = await request(reader, writer, "GET", "/stats")
+    writer.close()
+    await service.close()
+
+    latencies.sort()
+    print(f"{len(ledger)} posts from {args.clients} clients in {elapsed:.2f} s "
+          f"({len(ledger) / elapsed:,.0f} posts/s), {stats['batches']} batches")
+    print(f"latency p50 {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f} ms")
+    if len(manager.transactions) != len(ledger):
+        print(f"FAILED: {len(manager.transactions)} transactions stored, expected {len(ledger)}")
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--posts", type=int, default=100, help="Transactions posted per client")
+    parser.add_argument("--query-every", type=int, default=10, help="GET /balance after every N posts (0: never)")
+    parser.add_argument("--batch-delay", type=float, default=0.005)
+    args = parser.parse_args(argv)
+    with tempfile.TemporaryDirectory() as workdir:
+        return asyncio.run(run(args, workdir))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
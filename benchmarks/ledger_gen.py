@@ -0,0 +1,96 @@
+"""
+Synthetic ledger generator for benchmarks.
+
+Produces transactions in the Imperative shape (date, category, amount,
+transaction_type); to_declarative() converts them to the Declarative shape.
+"""
+import csv
+import json
+import random
+from datetime import date, timedelta
+
+from Core.money import parse_cents
+
+DEFAULT_EXPENSE_CATEGORIES = (
+    "Rent", "Food", "Transport", "Utilities", "Entertainment",
+    "Health", "Shopping", "Travel", "Education", "Insurance",
+)
+DEFAULT_INCOME_CATEGORIES = ("Salary", "Freelance", "Interest")
+
+
+def generate_ledger(rows, expense_categories=DEFAULT_EXPENSE_CATEGORIES,
+                    income_categories=DEFAULT_INCOME_CATEGORIES,
+                    start=date(2022, 1, 1), days=730, income_ratio=0.1, seed=0):
+    """
+    Generate a list of synthetic transactions sorted by date.
+
+    :param rows: Number of transactions to generate.
+    :param expense_categories: Category names used for expenses.
+    :param income_categories: Category names used for income.
+    :param start: First date of the ledger.
+    :param days: Length of the date span in days.
+    :param income_ratio: Fraction of rows that are income.
+    :param seed: Random seed, so runs are reproducible.
+    """
+    rng = random.Random(seed)
+    # Skewed category weights so a few categories dominate, as in real ledgers
+    weights = [1.0 / (i + 1) for i in range(len(expense_categories))]
+    offsets = sorted(rng.randrange(days) for _ in range(rows))
+    ledger = []
+    for offset in offsets:
+        day = start + timedelta(days=offset)
+        if rng.random() < income_ratio:
+            category = rng.choice(income_categories)
+            amount = round(rng.uniform(500, 5000), 2)
+            transaction_type = "Income"
+        else:
+            category = rng.choices(expense_categories, weights)[0]
+            amount = round(rng.lognormvariate(3.5, 1.0), 2)
+            transaction_type = "Expense"
+        ledger.append({
+            "date": f"{day.year}-{day.month}-{day.day}",
+            "category": category,
+            "amount": amount,
+            "transaction_type": transaction_type,
+        })
+    return ledger
+
+
+def generate_budgets(expense_categories=DEFAULT_EXPENSE_CATEGORIES, seed=0):
+    """Generate a monthly budget for each expense category."""
+    rng = random.Random(seed)
+    return {c: {"amount": float(rng.randrange(200, 3000, 100)), "period": "monthly"} for c in expense_categories}
+
+
+def generate_savings_goals(count=3, seed=0):
+    """Generate a few savings goals in the Imperative shape."""
+    rng = random.Random(seed)
+    return {
+        f"Goal {i + 1}": {
+            "target_amount": float(rng.randrange(1000, 20000, 500)),
+            "months_to_save": rng.randint(3, 24),
+            "saved_amount": 0,
+        }
+        for i in range(count)
+    }
+
+
+def to_declarative(ledger):
+    """Convert Imperative-shaped transactions to the Declarative dict shape (amounts in cents)."""
+    return tuple(
+        {"date": t["date"], "amount": parse_cents(t["amount"]), "category": t["category"], "type": t["transaction_type"].lower()}
+        for t in ledger
+    )
+
+
+def write_json(path, data):
+    with open(path, "w") as file:
+        json.dump(data, file)
+
+
+def write_csv(path, ledger):
+    """Write transactions as a CSV importable by FinanceManager.import_from_csv."""
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=["date", "category", "amount", "transaction_type"])
+        writer.writeheader()
+        writer.writerows(ledger)
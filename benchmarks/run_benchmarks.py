@@ -0,0 +1,148 @@
+"""
+Benchmark the Imperative and Declarative implementations on synthetic ledgers.
+
+Run from the repository root, e.g.:
+
+    python -m benchmarks.run_benchmarks --scales 1000,10000,100000 --output bench.json
+
+Each operation is timed best-of-N and the results are written as JSON so runs
+can be compared for regressions.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "Imperative", "PFManager"))
+sys.path.insert(0, os.path.join(ROOT, "Declarative"))
+
+import concepts  # noqa: E402
+from Finance_manager import FinanceManager  # noqa: E402
+from Core.money import parse_cents  # noqa: E402
+
+from benchmarks.ledger_gen import (  # noqa: E402
+    generate_budgets, generate_ledger, generate_savings_goals, to_declarative, write_csv, write_json,
+)
+
+
+def best_time(func, repeat, setup=None):
+    """Return the best wall time of func() over `repeat` runs, and its last stdout."""
+    best = None
+    output = ""
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            start = time.perf_counter()
+            func(*args)
+            elapsed = time.perf_counter() - start
+        output = buffer.getvalue()
+        best = elapsed if best is None else min(best, elapsed)
+    return best, output
+
+
+def quiet(func, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+def bench_scale(rows, repeat, workdir):
+    """Time every operation on a ledger of `rows` transactions."""
+    ledger = generate_ledger(rows)
+    budgets = generate_budgets()
+    goals = generate_savings_goals()
+
+    paths = {name: os.path.join(workdir, f"{rows}_{name}") for name in
+             ("transactions.json", "budgets.json", "savings.json", "import.csv", "empty.json",
+              "report.txt", "declarative_report.txt")}
+    write_json(paths["transactions.json"], ledger)
+    write_json(paths["budgets.json"], budgets)
+    write_json(paths["savings.json"], goals)
+    write_json(paths["empty.json"], [])
+    write_csv(paths["import.csv"], ledger)
+
+    def new_manager(data_file):
+        # Without the result cache, so repeated runs time the aggregation itself
+        return quiet(FinanceManager, data_file, paths["budgets.json"], paths["savings.json"], cache=False)
+
+    manager = new_manager(paths["transactions.json"])
+    first, last = ledger[0]["date"].split("-"), ledger[-1]["date"].split("-")
+    declarative = to_declarative(ledger)
+    declarative_budgets = {c: parse_cents(b["amount"]) for c, b in budgets.items()}
+    declarative_goals = []
+    for name, goal in goals.items():
+        declarative_goals = quiet(concepts.set_savings_goal, declarative_goals, name,
+                                  parse_cents(goal["target_amount"]), goal["months_to_save"])
+
+    operations = [
+        ("load", lambda: new_manager(paths["transactions.json"]), None),
+        ("save", manager.save_transactions, None),
+        ("import_csv", lambda m: m.import_from_csv(paths["import.csv"]),
+         lambda: (new_manager(paths["empty.json"]),)),
+        ("calculate_summary", manager.calculate_summary, None),
+        ("category_breakdown", manager.category_breakdown, None),
+        ("generate_spending_trends",
+         lambda: manager.generate_spending_trends(int(first[0]), int(first[1]), int(last[0]), int(last[1])), None),
+        ("export_financial_report", lambda: manager.export_financial_report(paths["report.txt"]), None),
+        ("declarative_export_report",
+         lambda: concepts.export_report(declarative, declarative_budgets, declarative_goals,
+                                        paths["declarative_report.txt"]), None),
+    ]
+
+    results = []
+    for name, func, setup in operations:
+        try:
+            seconds, output = best_time(func, repeat, setup)
+            # The report writers swallow their own exceptions and only print them
+            status = "error" if "error occurred" in output.lower() or "error exporting" in output.lower() else "ok"
+        except Exception as e:
+            seconds, status = None, f"error: {type(e).__name__}"
+        results.append({
+            "operation": name,
+            "rows": rows,
+            "seconds": seconds,
+            "rows_per_second": rows / seconds if seconds else None,
+            "repeat": repeat,
+            "status": status,
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", default="1000,10000,100000",
+                        help="Comma-separated ledger sizes (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per operation, best is kept")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    scales = [int(s) for s in args.scales.split(",")]
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in scales:
+            for r in bench_scale(rows, args.repeat, workdir):
+                results.append(r)
+                seconds = f"{r['seconds'] * 1000:10.2f} ms" if r["seconds"] is not None else f"{'-':>13}"
+                print(f"{r['rows']:>9} rows  {r['operation']:<28} {seconds}  {r['status']}")
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=4)
+        print(f"Results written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
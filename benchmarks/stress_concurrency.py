@@ -0,0 +1,101 @@
+"""
+Stress FinanceManager's thread-safe mode: reader threads compute summaries
+while a writer thread ingests transactions, and every read is checked for
+consistency.
+
+Run from the repository root:  python -m benchmarks.stress_concurrency
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "Imperative", "PFManager"))
+
+from Finance_manager import FinanceManager  # noqa: E402
+from transaction import Transaction  # noqa: E402
+
+from benchmarks.ledger_gen import generate_ledger  # noqa: E402
+
+
+def check_consistent(manager):
+    """Raise AssertionError if the aggregates disagree with each other or with the row count."""
+    with manager.reading():
+        total_income, total_expense, balance = manager.calculate_summary()
+        breakdown = manager.category_breakdown()
+        rows = len(manager.transactions)
+        assert rows == len(manager.ledger), "ledger and transaction list out of step"
+        assert abs(sum(v["Income"] for v in breakdown.values()) - total_income) < 1e-6, "income mismatch"
+        assert abs(sum(v["Expense"] for v in breakdown.values()) - total_expense) < 1e-6, "expense mismatch"
+        assert abs(total_income - total_expense - balance) < 1e-6, "balance mismatch"
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writes", type=int, default=500, help="Transactions the writer adds")
+    parser.add_argument("--batch", type=int, default=20, help="Transactions per add_transactions call")
+    parser.add_argument("--initial", type=int, default=10_000, help="Rows loaded before the test")
+    args = parser.parse_args(argv)
+
+    errors = []
+    reads = [0] * args.readers
+    done = threading.Event()
+
+    with tempfile.TemporaryDirectory() as workdir, contextlib.redirect_stdout(io.StringIO()):
+        manager = FinanceManager(os.path.join(workdir, "transactions.json"),
+                                 os.path.join(workdir, "budgets.json"),
+                                 os.path.join(workdir, "savings.json"), thread_safe=True)
+        for t in generate_ledger(args.initial, seed=1):
+            manager._ingest(Transaction.from_dict(t))
+        incoming = [Transaction.from_dict(t) for t in generate_ledger(args.writes, seed=2)]
+
+        def reader(slot):
+            while not done.is_set():
+                try:
+                    check_consistent(manager)
+                except Exception as e:  # collected and reported by the main thread
+                    errors.append(e)
+                    return
+                reads[slot] += 1
+
+        def writer():
+            try:
+                for start in range(0, len(incoming), args.batch):
+                    manager.add_transactions(incoming[start:start + args.batch])
+            except Exception as e:
+                errors.append(e)
+            finally:
+                done.set()
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+        threads.append(threading.Thread(target=writer))
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+        final_rows = check_consistent(manager)
+        on_disk = len(FinanceManager(manager.data_file, manager.budget_file, manager.savings_file).transactions)
+
+    print(f"{args.readers} readers, {args.writes} writes in {elapsed:.2f} s: "
+          f"{sum(reads)} consistent reads, {final_rows} rows in memory, {on_disk} on disk")
+    if errors:
+        print(f"FAILED: {errors[0]!r}")
+        return 1
+    if final_rows != args.initial + args.writes or on_disk != final_rows:
+        print("FAILED: lost writes")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())